@@ -0,0 +1,114 @@
+"""Benchmarks of the MGM API client against the fake server."""
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import pytest
+
+from custom_components.hava_durumu import api
+from custom_components.hava_durumu.api import MGMApiClient
+from custom_components.hava_durumu.archive import ResponseRecorder, read_archive
+from custom_components.hava_durumu.coordinator import (
+    async_close_session,
+    async_get_session,
+)
+
+from .conftest import ENTRY_COUNTS, Bench
+from .fake_mgm import FakeMGMServer
+
+
+async def bench_get_all_data_cold(
+    hass: HomeAssistant, fake_mgm: FakeMGMServer, bench: Bench
+) -> None:
+    """Full downloads with a fresh client, no validators to send."""
+    session = async_get_clientsession(hass)
+
+    async def run() -> None:
+        await MGMApiClient(session, fake_mgm.base_url).get_all_data(90000)
+
+    await bench.measure("api.get_all_data cold", 1, run)
+
+
+async def bench_get_all_data_not_modified(
+    hass: HomeAssistant, fake_mgm: FakeMGMServer, bench: Bench
+) -> None:
+    """Repeated requests answered with 304."""
+    client = MGMApiClient(async_get_clientsession(hass), fake_mgm.base_url)
+    await client.get_all_data(90000)
+    fake_mgm.reset_stats()
+
+    await bench.measure("api.get_all_data 304", 1, lambda: client.get_all_data(90000))
+    assert fake_mgm.statuses[304] > 0
+
+
+async def bench_get_all_data_seeded(
+    hass: HomeAssistant, fake_mgm: FakeMGMServer, bench: Bench, tmp_path: Path
+) -> None:
+    """First requests of a client seeded from an archive, answered with 304."""
+    session = async_get_clientsession(hass)
+    recorder = ResponseRecorder(str(tmp_path / "responses.jsonl.gz"))
+    await MGMApiClient(session, fake_mgm.base_url, recorder=recorder).get_all_data(90000)
+    await recorder.async_flush()
+    archived = await hass.async_add_executor_job(read_archive, recorder.path)
+    client = MGMApiClient(session, fake_mgm.base_url)
+
+    async def setup() -> None:
+        nonlocal client
+        client = MGMApiClient(session, fake_mgm.base_url)
+        client.seed_cache(archived)
+        fake_mgm.reset_stats()
+
+    async def run() -> None:
+        await client.get_all_data(90000)
+
+    await bench.measure("api.get_all_data seeded", 1, run, setup)
+
+
+@pytest.mark.parametrize("pool", ["shared", "dedicated"])
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+async def bench_get_all_data_concurrent(
+    hass: HomeAssistant, fake_mgm: FakeMGMServer, bench: Bench, entries: int, pool: str
+) -> None:
+    """Many locations fetched at once, each with changed data.
+
+    Runs on Home Assistant's shared session and on the integration's own
+    connection pool.
+    """
+    session = async_get_session(hass) if pool == "dedicated" else async_get_clientsession(hass)
+    client = MGMApiClient(session, fake_mgm.base_url)
+
+    async def run() -> None:
+        await asyncio.gather(
+            *(client.get_all_data(90000 + index) for index in range(entries))
+        )
+
+    async def setup() -> None:
+        fake_mgm.advance()
+
+    await bench.measure(f"api.get_all_data concurrent {pool}", entries, run, setup)
+    await async_close_session(hass)
+
+
+@pytest.mark.parametrize("decoder", ["stdlib inline", "default"])
+async def bench_decode_large_alerts(
+    hass: HomeAssistant, fake_mgm: FakeMGMServer, bench: Bench, decoder: str
+) -> None:
+    """Nationwide alerts with a large payload, decoded by the stdlib on the loop and by default."""
+    fake_mgm.config.alert_count = 20000
+    fake_mgm.config.validators = False
+    client = MGMApiClient(async_get_clientsession(hass), fake_mgm.base_url)
+    # Build the payload on the server before measuring
+    await client.get_alerts()
+
+    if decoder == "default":
+        await bench.measure(f"api.get_alerts large {decoder}", 1, client.get_alerts)
+        return
+    with patch.object(api, "json_loads", json.loads), patch.object(
+        api, "DECODE_EXECUTOR_THRESHOLD", float("inf")
+    ):
+        await bench.measure(f"api.get_alerts large {decoder}", 1, client.get_alerts)
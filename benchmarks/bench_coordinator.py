@@ -0,0 +1,96 @@
+"""Benchmarks of the coordinators and entity state writes."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.hava_durumu.coordinator import HavaDurumuDataUpdateCoordinator
+from custom_components.hava_durumu.trends import TrendRing
+
+from .conftest import ENTRY_COUNTS, Bench
+from .fake_mgm import FakeMGMServer
+
+SetupEntries = Callable[[int], Awaitable[list[HavaDurumuDataUpdateCoordinator]]]
+
+
+async def _refresh_all(coordinators: list[HavaDurumuDataUpdateCoordinator]) -> None:
+    """Refresh every section of every location."""
+    for coordinator in coordinators:
+        coordinator.async_mark_all_due()
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+async def bench_coordinator_update_changed(
+    hass: HomeAssistant,
+    fake_mgm: FakeMGMServer,
+    bench: Bench,
+    setup_entries: SetupEntries,
+    entries: int,
+) -> None:
+    """Refresh all locations when MGM published new data, state writes included."""
+    coordinators = await setup_entries(entries)
+
+    async def setup() -> None:
+        fake_mgm.advance()
+
+    await bench.measure(
+        "coordinator.update changed", entries, lambda: _refresh_all(coordinators), setup
+    )
+
+
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+async def bench_coordinator_update_unchanged(
+    hass: HomeAssistant,
+    fake_mgm: FakeMGMServer,
+    bench: Bench,
+    setup_entries: SetupEntries,
+    entries: int,
+) -> None:
+    """Refresh all locations when nothing changed upstream (304 everywhere)."""
+    coordinators = await setup_entries(entries)
+
+    await bench.measure(
+        "coordinator.update unchanged", entries, lambda: _refresh_all(coordinators)
+    )
+
+
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+async def bench_entity_state_writes(
+    hass: HomeAssistant,
+    fake_mgm: FakeMGMServer,
+    bench: Bench,
+    setup_entries: SetupEntries,
+    entries: int,
+) -> None:
+    """Fan out a coordinator update in which every section changed to all entities."""
+    coordinators = await setup_entries(entries)
+
+    async def setup() -> None:
+        for coordinator in coordinators:
+            for section in coordinator.data:
+                coordinator.generations[section] = coordinator.generations.get(section, 0) + 1
+
+    async def run() -> None:
+        for coordinator in coordinators:
+            coordinator.async_update_listeners()
+
+    await bench.measure("entities.state_write", entries, run, setup)
+
+
+async def bench_trend_observations(hass: HomeAssistant, bench: Bench) -> None:
+    """A day of 5 minute observations added to a trend ring."""
+    ring = TrendRing()
+
+    async def setup() -> None:
+        nonlocal ring
+        ring = TrendRing()
+
+    async def run() -> None:
+        for sample in range(24 * 12):
+            ring.append(sample * 300.0, 1000 + sample * 0.1)
+
+    await bench.measure("trends.append 5 min day", 1, run, setup)
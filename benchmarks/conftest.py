@@ -0,0 +1,213 @@
+"""Fixtures and result reporting for the Hava Durumu benchmarks.
+
+Run from the repository root:
+
+    pip install -r benchmarks/requirements.txt
+    pytest -c benchmarks/pytest.ini benchmarks --bench-json=results.json
+
+HAVA_BENCH_ENTRIES (default "1,50,500") sets the config entry counts,
+HAVA_BENCH_ROUNDS (default 5) the measured rounds per benchmark and
+HAVA_BENCH_LATENCY (default 0) the fake server latency in seconds.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # noqa: E402
+
+from custom_components.hava_durumu.const import DOMAIN  # noqa: E402
+from custom_components.hava_durumu.coordinator import (  # noqa: E402
+    HavaDurumuDataUpdateCoordinator,
+)
+
+from .fake_mgm import FakeMGMConfig, FakeMGMServer  # noqa: E402
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+ENTRY_COUNTS = [int(count) for count in os.environ.get("HAVA_BENCH_ENTRIES", "1,50,500").split(",")]
+ROUNDS = int(os.environ.get("HAVA_BENCH_ROUNDS", "5"))
+LATENCY = float(os.environ.get("HAVA_BENCH_LATENCY", "0"))
+
+
+@dataclass
+class BenchResult:
+    """Timings of one benchmark."""
+
+    name: str
+    entries: int
+    samples: list[float] = field(default_factory=list)
+    # Longest event loop stall of each round
+    blocks: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary of the timings in milliseconds."""
+        samples = sorted(self.samples)
+        return {
+            "name": self.name,
+            "entries": self.entries,
+            "rounds": len(samples),
+            "median_ms": round(statistics.median(samples) * 1000, 3),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 3),
+            "max_ms": round(samples[-1] * 1000, 3),
+            "max_block_ms": round(max(self.blocks, default=0.0) * 1000, 3),
+        }
+
+
+RESULTS: list[BenchResult] = []
+
+
+class LoopBlockMonitor:
+    """Measure how long the event loop is blocked while code runs.
+
+    A ticker sleeps TICK seconds in a loop, anything it oversleeps is time
+    in which the loop could not run other callbacks.
+    """
+
+    TICK = 0.001
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.max_block = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    async def _tick(self) -> None:
+        """Record the delay of every tick."""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.TICK)
+            self.max_block = max(self.max_block, time.perf_counter() - start - self.TICK)
+
+    async def __aenter__(self) -> LoopBlockMonitor:
+        """Start the ticker."""
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        # Let the ticker start before the measured code takes the loop
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the ticker."""
+        assert self._task is not None
+        self._task.cancel()
+
+
+class Bench:
+    """Measure and record async callables."""
+
+    async def measure(
+        self,
+        name: str,
+        entries: int,
+        func: Callable[[], Awaitable[Any]],
+        setup: Callable[[], Awaitable[Any]] | None = None,
+        rounds: int = ROUNDS,
+    ) -> BenchResult:
+        """Time `rounds` calls of func, running setup untimed before each one."""
+        result = BenchResult(name, entries)
+        for _ in range(rounds):
+            if setup is not None:
+                await setup()
+            async with LoopBlockMonitor() as monitor:
+                start = time.perf_counter()
+                await func()
+                result.samples.append(time.perf_counter() - start)
+            result.blocks.append(monitor.max_block)
+        RESULTS.append(result)
+        return result
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the result file option."""
+    parser.addoption("--bench-json", default=None, help="write benchmark results to this file")
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    """Print the results and write them to the result file."""
+    if not RESULTS:
+        return
+    rows = [result.as_dict() for result in RESULTS]
+    terminalreporter.section("hava_durumu benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<40}{'entries':>8}{'median ms':>12}{'p95 ms':>12}{'max ms':>12}"
+        f"{'block ms':>12}"
+    )
+    for row in rows:
+        terminalreporter.write_line(
+            f"{row['name']:<40}{row['entries']:>8}{row['median_ms']:>12}"
+            f"{row['p95_ms']:>12}{row['max_ms']:>12}{row['max_block_ms']:>12}"
+        )
+    if path := config.getoption("--bench-json"):
+        Path(path).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def bench() -> Bench:
+    """Return the benchmark recorder."""
+    return Bench()
+
+
+@pytest.fixture
+async def fake_mgm(
+    hass: HomeAssistant, socket_enabled: None
+) -> AsyncGenerator[FakeMGMServer, None]:
+    """Start the fake MGM server on localhost and point every API client at it.
+
+    The minimum refetch age is disabled so repeated rounds reach the server.
+    """
+    server = FakeMGMServer(FakeMGMConfig(latency=LATENCY))
+    base_url = await server.start()
+    with patch("custom_components.hava_durumu.api.API_BASE_URL", base_url), patch.dict(
+        "custom_components.hava_durumu.api.MIN_REFETCH_AGE", clear=True
+    ):
+        yield server
+    await server.stop()
+
+
+@pytest.fixture
+def setup_entries(
+    hass: HomeAssistant, fake_mgm: FakeMGMServer
+) -> Callable[[int], Awaitable[list[HavaDurumuDataUpdateCoordinator]]]:
+    """Return a helper that sets up a number of locations."""
+
+    async def setup(count: int) -> list[HavaDurumuDataUpdateCoordinator]:
+        await async_setup_component(hass, "persistent_notification", {})
+        entries = []
+        for index in range(count):
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                title=f"Bench {index}",
+                data={
+                    "merkez_id": 90000 + index,
+                    "province": "Ankara",
+                    "district": f"Bench {index}",
+                },
+                unique_id=str(90000 + index),
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+        # Setting up one entry sets up the integration and with it every entry
+        assert await hass.config_entries.async_setup(entries[0].entry_id)
+        await hass.async_block_till_done()
+        return [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+
+    return setup
@@ -0,0 +1,331 @@
+"""Local stand-in for the MGM mobile API (servis.mgm.gov.tr/mobile).
+
+Serves deterministic payloads for the endpoints in const.py with
+configurable latency, payload sizes, error rate and 304 behavior.
+
+Run it on its own to point a development Home Assistant at it:
+
+    python -m benchmarks.fake_mgm --port 8099 --latency 0.05 --error-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import hashlib
+import json
+import random
+from typing import Any, Callable
+
+from aiohttp import web
+
+PREFIX = "/mobile"
+
+PROVINCES = (
+    "Adana", "Ankara", "Antalya", "Bursa", "Diyarbakır", "Erzurum", "Eskişehir",
+    "Gaziantep", "İstanbul", "İzmir", "Kayseri", "Konya", "Muğla", "Samsun",
+    "Trabzon", "Van",
+)
+CONDITIONS = ("A", "AB", "PB", "CB", "HY", "Y", "KY", "KKY", "K", "SIS", "GSY")
+
+
+@dataclass
+class FakeMGMConfig:
+    """Behavior of the fake server."""
+
+    # Seconds added to every response, plus up to `jitter` seconds at random
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Fraction of requests answered with HTTP 500
+    error_rate: float = 0.0
+    # Payload sizes
+    hourly_slots: int = 24
+    alert_count: int = 3
+    meteoalarm_count: int = 3
+    districts_per_province: int = 12
+    # Send an ETag and answer matching conditional requests with 304
+    validators: bool = True
+    seed: int = 0
+
+
+class FakeMGMServer:
+    """aiohttp application imitating the MGM endpoints used by the integration."""
+
+    def __init__(self, config: FakeMGMConfig | None = None) -> None:
+        """Initialize the server."""
+        self.config = config or FakeMGMConfig()
+        # Bumped by advance(), every payload changes with it
+        self.generation = 0
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self._random = random.Random(self.config.seed)
+        # Encoded payloads of the current generation, so building large
+        # payloads does not block the event loop shared with the client
+        self._bodies: dict[tuple[str, str], bytes] = {}
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+        handlers: dict[str, Callable[[web.Request], Any]] = {
+            "/merkezler/iller": self._provinces,
+            "/merkezler": self._search,
+            "/sondurumlar": self._current,
+            "/tahminler/saatlik": self._hourly,
+            "/tahminler/gunluk": self._daily,
+            "/alarmlar": self._alerts,
+            "/alarmlar/detay": self._alert_detail,
+            "/meteoalarm/today": self._meteoalarm,
+            "/meteoalarm/tomorrow": self._meteoalarm,
+        }
+        self.app = web.Application()
+        for path, payload in handlers.items():
+            self.app.router.add_get(f"{PREFIX}{path}", self._handler(path, payload))
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL to pass to MGMApiClient."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}{PREFIX}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def advance(self) -> None:
+        """Publish new data for every endpoint."""
+        self.generation += 1
+        self._bodies.clear()
+
+    def reset_stats(self) -> None:
+        """Forget the request counters."""
+        self.requests.clear()
+        self.statuses.clear()
+
+    def _handler(
+        self, path: str, payload: Callable[[web.Request], Any]
+    ) -> Callable[[web.Request], Any]:
+        """Wrap a payload builder with latency, errors and validators."""
+
+        async def handle(request: web.Request) -> web.Response:
+            self.requests[path] += 1
+            config = self.config
+            if delay := config.latency + self._random.uniform(0, config.jitter):
+                await asyncio.sleep(delay)
+
+            if self._random.random() < config.error_rate:
+                return self._respond(web.Response(status=500, text="Internal Server Error"))
+
+            if (body := self._bodies.get(key := (path, request.query_string))) is None:
+                body = self._bodies[key] = json.dumps(
+                    payload(request), ensure_ascii=False, separators=(",", ":")
+                ).encode()
+            headers = {}
+            if config.validators:
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if request.headers.get("If-None-Match") == etag:
+                    return self._respond(web.Response(status=304, headers={"ETag": etag}))
+                headers["ETag"] = etag
+            return self._respond(
+                web.Response(
+                    body=body,
+                    content_type="application/json",
+                    charset="utf-8",
+                    headers=headers,
+                )
+            )
+
+        return handle
+
+    def _respond(self, response: web.Response) -> web.Response:
+        """Count a response status."""
+        self.statuses[response.status] += 1
+        return response
+
+    def _merkez_id(self, request: web.Request) -> int:
+        """Return the location of a request."""
+        return int(request.query.get("merkezid") or request.query.get("istno") or 0)
+
+    def _value(self, merkez_id: int, salt: int, low: float, high: float) -> float:
+        """Return a stable value for a location, salt and data generation."""
+        seed = (merkez_id * 7919 + salt * 104729 + self.generation * 1299709) % 2**32
+        return round(low + (high - low) * random.Random(seed).random(), 1)
+
+    def _condition(self, merkez_id: int, salt: int) -> str:
+        """Return a stable MGM condition code."""
+        # _value rounds, which could reach len(CONDITIONS)
+        return CONDITIONS[min(int(self._value(merkez_id, salt, 0, len(CONDITIONS))), len(CONDITIONS) - 1)]
+
+    def _locations(self) -> list[dict[str, Any]]:
+        """Return every fake location."""
+        locations = []
+        for province_number, province in enumerate(PROVINCES, start=1):
+            for district in range(self.config.districts_per_province):
+                locations.append(
+                    {
+                        "il": province,
+                        "ilce": province if district == 0 else f"{province} {district}",
+                        "merkezId": 90000 + province_number * 100 + district,
+                        "enlem": 36 + province_number * 0.4 + district * 0.01,
+                        "boylam": 26 + province_number * 1.1 + district * 0.01,
+                    }
+                )
+        return locations
+
+    def _provinces(self, request: web.Request) -> list[dict[str, Any]]:
+        """Serve /merkezler/iller."""
+        return [location for location in self._locations() if location["il"] == location["ilce"]]
+
+    def _search(self, request: web.Request) -> list[dict[str, Any]]:
+        """Serve /merkezler."""
+        query = request.query.get("sorgu", "").lower()
+        limit = int(request.query.get("limit", 15))
+        return [
+            location
+            for location in self._locations()
+            if location["il"].lower().startswith(query) or location["ilce"].lower().startswith(query)
+        ][:limit]
+
+    def _current(self, request: web.Request) -> list[dict[str, Any]]:
+        """Serve /sondurumlar."""
+        merkez_id = self._merkez_id(request)
+        return [
+            {
+                "istNo": merkez_id,
+                "veriZamani": f"2026-10-17T{self.generation % 24:02d}:00:00.000Z",
+                "sicaklik": self._value(merkez_id, 1, -5, 35),
+                "hissedilenSicaklik": self._value(merkez_id, 2, -8, 38),
+                "nem": self._value(merkez_id, 3, 10, 100),
+                "ruzgarHiz": self._value(merkez_id, 4, 0, 60),
+                "ruzgarYon": self._value(merkez_id, 5, 0, 359),
+                "denizeIndirgenmisBasinc": self._value(merkez_id, 6, 990, 1030),
+                "aktuelBasinc": self._value(merkez_id, 7, 880, 1020),
+                "gorus": -9999,
+                "kapalilik": int(self._value(merkez_id, 8, 0, 8)),
+                "hadiseKodu": self._condition(merkez_id, 9),
+                "yagis00Now": self._value(merkez_id, 10, 0, 2),
+                "yagis10Dk": -9999,
+                "yagis1Saat": self._value(merkez_id, 11, 0, 5),
+                "yagis6Saat": self._value(merkez_id, 12, 0, 10),
+                "yagis12Saat": -9999,
+                "yagis24Saat": self._value(merkez_id, 13, 0, 30),
+            }
+        ]
+
+    def _hourly(self, request: web.Request) -> list[dict[str, Any]]:
+        """Serve /tahminler/saatlik."""
+        merkez_id = self._merkez_id(request)
+        return [
+            {
+                "merkezId": merkez_id,
+                "tahmin": [
+                    {
+                        "tarih": f"2026-10-{17 + slot // 8:02d}T{slot % 8 * 3:02d}:00:00.000Z",
+                        "hadise": self._condition(merkez_id, 100 + slot),
+                        "sicaklik": self._value(merkez_id, 200 + slot, -5, 35),
+                        "nem": self._value(merkez_id, 300 + slot, 10, 100),
+                        "ruzgarHizi": self._value(merkez_id, 400 + slot, 0, 60),
+                        "ruzgarYonu": self._value(merkez_id, 500 + slot, 0, 359),
+                    }
+                    for slot in range(self.config.hourly_slots)
+                ],
+            }
+        ]
+
+    def _daily(self, request: web.Request) -> list[dict[str, Any]]:
+        """Serve /tahminler/gunluk."""
+        merkez_id = self._merkez_id(request)
+        day: dict[str, Any] = {"istNo": merkez_id}
+        for index in range(6):
+            low = self._value(merkez_id, 600 + index, -5, 20)
+            day.update(
+                {
+                    f"tarihGun{index}": f"2026-10-{17 + index:02d}T00:00:00.000Z",
+                    f"hadiseGun{index}": self._condition(merkez_id, 700 + index),
+                    f"enDusukGun{index}": low,
+                    f"enYuksekGun{index}": low + self._value(merkez_id, 800 + index, 3, 15),
+                    f"enDusukNemGun{index}": self._value(merkez_id, 900 + index, 10, 50),
+                    f"enYuksekNemGun{index}": self._value(merkez_id, 1000 + index, 50, 100),
+                    f"ruzgarHizGun{index}": self._value(merkez_id, 1100 + index, 0, 60),
+                    f"ruzgarYonGun{index}": self._value(merkez_id, 1200 + index, 0, 359),
+                }
+            )
+        return [day]
+
+    def _alerts(self, request: web.Request) -> list[dict[str, Any]]:
+        """Serve /alarmlar."""
+        return [
+            {
+                "alarmNo": f"{self.generation}-{index}",
+                "baslik": "Kuvvetli Yağış Uyarısı",
+                "aciklama": "Gök gürültülü sağanak yağış bekleniyor.",
+                "hadiseCinsi": "yagis",
+                "baslangic": "2026-10-17T12:00:00.000Z",
+                "il": PROVINCES[(index + self.generation) % len(PROVINCES)],
+            }
+            for index in range(self.config.alert_count)
+        ]
+
+    def _alert_detail(self, request: web.Request) -> dict[str, Any]:
+        """Serve /alarmlar/detay."""
+        return {"alarmNo": request.query.get("alarmNo"), "metin": "Uyarı detayı"}
+
+    def _meteoalarm(self, request: web.Request) -> list[dict[str, Any]]:
+        """Serve /meteoalarm/today and /meteoalarm/tomorrow."""
+        return [
+            {
+                "seviye": "sarı",
+                "bolge": PROVINCES[(index * 3 + self.generation) % len(PROVINCES)],
+                "aciklama": "Kuvvetli rüzgar",
+            }
+            for index in range(self.config.meteoalarm_count)
+        ]
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run the fake server until interrupted."""
+    server = FakeMGMServer(
+        FakeMGMConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            hourly_slots=args.hourly_slots,
+            alert_count=args.alerts,
+            validators=not args.no_validators,
+        )
+    )
+    print(f"Serving fake MGM API at {await server.start(args.host, args.port)}")
+    try:
+        while True:
+            await asyncio.sleep(args.advance or 3600)
+            if args.advance:
+                server.advance()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Parse the command line and serve."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500s")
+    parser.add_argument("--hourly-slots", type=int, default=24)
+    parser.add_argument("--alerts", type=int, default=3)
+    parser.add_argument("--no-validators", action="store_true", help="never answer 304")
+    parser.add_argument("--advance", type=float, default=0.0, help="publish new data every N seconds")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,228 @@
 """The Hava Durumu integration."""
 from __future__ import annotations
 
+import gzip
 import logging
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
+from homeassistant.const import (
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
-from .coordinator import HavaDurumuDataUpdateCoordinator
+from .archive import (
+    ResponseRecorder,
+    ResponseReplay,
+    group_by_location,
+    read_archive,
+)
+from .const import (
+    CONF_BATCH_MODE,
+    CONF_LOCATIONS,
+    CONF_NEIGHBOR_FALLBACK,
+    CONF_RECORD,
+    CONF_REPLAY,
+    DATA_ALERTS_COORDINATOR,
+    DATA_BATCH_COORDINATOR,
+    DATA_NEIGHBORS,
+    DATA_REFRESH_SCHEDULER,
+    DATA_RECORDER,
+    DATA_REPLAY,
+    DATA_WARM_RESPONSES,
+    DOMAIN,
+    PLATFORMS,
+)
+from .coordinator import (
+    HavaDurumuAlertsCoordinator,
+    HavaDurumuBatchCoordinator,
+    HavaDurumuDataUpdateCoordinator,
+    async_close_session,
+    snapshot_store,
+)
+from .locations import async_get_location_cache
+from .neighbors import NeighborLookup
+from .scheduler import RefreshScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.WEATHER, Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON]
 
+# Locations are set up from the UI or imported by coordinates, the other
+# configuration.yaml settings record and replay MGM responses
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                vol.Optional(CONF_RECORD): cv.string,
+                vol.Optional(CONF_REPLAY): cv.string,
+                vol.Optional(CONF_LOCATIONS): vol.All(
+                    cv.ensure_list,
+                    [
+                        vol.Schema(
+                            {
+                                vol.Required(CONF_LATITUDE): cv.latitude,
+                                vol.Required(CONF_LONGITUDE): cv.longitude,
+                            }
+                        )
+                    ],
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def _async_read_archive(hass: HomeAssistant, path: str) -> ResponseReplay | None:
+    """Read an archive of MGM responses in the executor."""
+    try:
+        responses = await hass.async_add_executor_job(read_archive, path)
+    except FileNotFoundError:
+        return None
+    except (OSError, gzip.BadGzipFile) as err:
+        _LOGGER.error("Could not read MGM responses from %s: %s", path, err)
+        return None
+    return ResponseReplay(responses)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up recording or replay of MGM responses and import locations."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (conf := config.get(DOMAIN)) is None:
+        return True
+
+    if replay_path := conf.get(CONF_REPLAY):
+        path = hass.config.path(replay_path)
+        if (replay := await _async_read_archive(hass, path)) is not None:
+            domain_data[DATA_REPLAY] = replay
+            _LOGGER.warning(
+                "Serving %d recorded MGM requests from %s, MGM is not contacted",
+                len(replay),
+                path,
+            )
+
+    if record_path := conf.get(CONF_RECORD):
+        path = hass.config.path(record_path)
+        # The last recorded responses provide validators for the first requests
+        if (recorded := await _async_read_archive(hass, path)) is not None:
+            domain_data[DATA_WARM_RESPONSES] = group_by_location(recorded.latest())
+        recorder = domain_data[DATA_RECORDER] = ResponseRecorder(path)
+        _LOGGER.info("Recording MGM responses to %s", path)
+
+        async def _async_flush_recorder(event: Event) -> None:
+            """Write the remaining responses on shutdown."""
+            await recorder.async_flush()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_recorder)
+
+    # Each location becomes a config entry for the MGM location nearest to it
+    for location in conf.get(CONF_LOCATIONS, []):
+        hass.async_create_task(
+            hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data=location
+            )
+        )
+
+    return True
+
+
+def _async_get_alerts_coordinator(hass: HomeAssistant) -> HavaDurumuAlertsCoordinator:
+    """Return the alerts coordinator shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_ALERTS_COORDINATOR not in domain_data:
+        domain_data[DATA_ALERTS_COORDINATOR] = HavaDurumuAlertsCoordinator(hass)
+    return domain_data[DATA_ALERTS_COORDINATOR]
+
+
+def _async_get_batch_coordinator(hass: HomeAssistant) -> HavaDurumuBatchCoordinator:
+    """Return the coordinator refreshing the locations in batch mode."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_BATCH_COORDINATOR not in domain_data:
+        domain_data[DATA_BATCH_COORDINATOR] = HavaDurumuBatchCoordinator(hass)
+    return domain_data[DATA_BATCH_COORDINATOR]
+
+
+def _async_get_neighbor_lookup(hass: HomeAssistant) -> NeighborLookup:
+    """Return the nearby station lookup shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_NEIGHBORS not in domain_data:
+        domain_data[DATA_NEIGHBORS] = NeighborLookup(hass)
+    return domain_data[DATA_NEIGHBORS]
+
+
+def _async_get_refresh_scheduler(hass: HomeAssistant) -> RefreshScheduler:
+    """Return the refresh scheduler shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_REFRESH_SCHEDULER not in domain_data:
+        domain_data[DATA_REFRESH_SCHEDULER] = RefreshScheduler()
+    return domain_data[DATA_REFRESH_SCHEDULER]
+
+
+async def _async_refresh_in_background(
+    alerts_coordinator: HavaDurumuAlertsCoordinator,
+    coordinator: HavaDurumuDataUpdateCoordinator,
+) -> None:
+    """Replace saved data with live data once MGM responds."""
+    await alerts_coordinator.async_ensure_data()
+    await coordinator.async_refresh()
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hava Durumu from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    coordinator = HavaDurumuDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # Nationwide alerts are fetched once and fanned out to every location
+    alerts_coordinator = _async_get_alerts_coordinator(hass)
+    alerts_coordinator.async_update_interval_from_entries()
+
+    # In batch mode one coordinator refreshes all batched locations together
+    batch = (
+        _async_get_batch_coordinator(hass)
+        if entry.options.get(CONF_BATCH_MODE, False)
+        else None
+    )
+
+    # Fields the station does not measure can be taken from nearby stations
+    neighbors = (
+        _async_get_neighbor_lookup(hass)
+        if entry.options.get(CONF_NEIGHBOR_FALLBACK, False)
+        else None
+    )
+
+    coordinator = HavaDurumuDataUpdateCoordinator(
+        hass, entry, alerts_coordinator, _async_get_refresh_scheduler(hass), batch, neighbors
+    )
+
+    if await coordinator.async_load_snapshot():
+        # Entities start with the saved data, the live refresh runs in the background
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_in_background(alerts_coordinator, coordinator),
+            f"{DOMAIN}_refresh_{entry.entry_id}",
+        )
+    else:
+        await alerts_coordinator.async_ensure_data()
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    entry.async_on_unload(
+        alerts_coordinator.async_add_listener(coordinator.async_handle_alerts_update)
+    )
+    if batch is not None:
+        entry.async_on_unload(batch.async_add_member(coordinator))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Keep the location list of the config flow up to date
+    await async_get_location_cache(hass).async_refresh_if_stale()
+
     # Add update listener for options changes
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
@@ -42,9 +239,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Drop the shared alerts coordinator together with the last location
+        if not any(
+            isinstance(value, HavaDurumuDataUpdateCoordinator)
+            for value in hass.data[DOMAIN].values()
+        ):
+            hass.data[DOMAIN].pop(DATA_REFRESH_SCHEDULER, None)
+            batch = hass.data[DOMAIN].pop(DATA_BATCH_COORDINATOR, None)
+            if batch is not None:
+                await batch.async_shutdown()
+            alerts_coordinator = hass.data[DOMAIN].pop(DATA_ALERTS_COORDINATOR, None)
+            if alerts_coordinator is not None:
+                await alerts_coordinator.async_shutdown()
+            await async_close_session(hass)
+
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove saved data of a deleted config entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
@@ -0,0 +1,162 @@
+"""Location index for nationwide MGM alerts."""
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable
+
+from .util import turkish_casefold
+
+# Geographical regions used in MeteoAlarm "bolge" texts
+REGION_PROVINCES: dict[str, tuple[str, ...]] = {
+    "Marmara": (
+        "Balıkesir", "Bilecik", "Bursa", "Çanakkale", "Edirne", "İstanbul",
+        "Kırklareli", "Kocaeli", "Sakarya", "Tekirdağ", "Yalova",
+    ),
+    "Ege": (
+        "Afyonkarahisar", "Aydın", "Denizli", "İzmir", "Kütahya", "Manisa",
+        "Muğla", "Uşak",
+    ),
+    "Akdeniz": (
+        "Adana", "Antalya", "Burdur", "Hatay", "Isparta", "Kahramanmaraş",
+        "Mersin", "Osmaniye",
+    ),
+    "İç Anadolu": (
+        "Aksaray", "Ankara", "Çankırı", "Eskişehir", "Karaman", "Kayseri",
+        "Kırıkkale", "Kırşehir", "Konya", "Nevşehir", "Niğde", "Sivas", "Yozgat",
+    ),
+    "Karadeniz": (
+        "Amasya", "Artvin", "Bartın", "Bayburt", "Bolu", "Çorum", "Düzce",
+        "Giresun", "Gümüşhane", "Karabük", "Kastamonu", "Ordu", "Rize",
+        "Samsun", "Sinop", "Tokat", "Trabzon", "Zonguldak",
+    ),
+    "Doğu Anadolu": (
+        "Ağrı", "Ardahan", "Bingöl", "Bitlis", "Elazığ", "Erzincan", "Erzurum",
+        "Hakkari", "Iğdır", "Kars", "Malatya", "Muş", "Tunceli", "Van",
+    ),
+    "Güneydoğu Anadolu": (
+        "Adıyaman", "Batman", "Diyarbakır", "Gaziantep", "Kilis", "Mardin",
+        "Siirt", "Şanlıurfa", "Şırnak",
+    ),
+}
+
+_REGION_KEYS: dict[str, tuple[str, ...]] = {
+    turkish_casefold(region): tuple(turkish_casefold(province) for province in provinces)
+    for region, provinces in REGION_PROVINCES.items()
+}
+_PROVINCE_KEYS = frozenset(
+    province for provinces in _REGION_KEYS.values() for province in provinces
+)
+
+# Alert fields naming the provinces and centers an alert applies to
+_PROVINCE_FIELDS = ("il", "iller")
+_CENTER_FIELDS = ("merkezId", "merkezIdler", "merkezler")
+_AREA_FIELDS = ("bolge",)
+ALERT_PLACE_FIELDS = _PROVINCE_FIELDS + _CENTER_FIELDS + _AREA_FIELDS
+
+_AREA_SEPARATORS = re.compile(r"\s*(?:[,;/\-]|\bve\b)\s*")
+_REGION_SUFFIX = re.compile(r"\s+b[öo]lge(si)?$")
+
+
+def _names(value: Any) -> list[str]:
+    """Return the place names in a string or list field."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = _AREA_SEPARATORS.split(value)
+    if not isinstance(value, (list, tuple)):
+        return []
+    return [turkish_casefold(name) for name in value if isinstance(name, str) and name.strip()]
+
+
+def _center_ids(value: Any) -> list[int]:
+    """Return the center IDs in an int, string or list field."""
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, (list, tuple)):
+        value = [value]
+    ids = []
+    for center in value:
+        try:
+            ids.append(int(center))
+        except (TypeError, ValueError):
+            continue
+    return ids
+
+
+def _area_provinces(name: str) -> tuple[str | None, ...]:
+    """Expand a region name to its provinces, keep province names as they are.
+
+    Names that are neither, for example sub-regions like "Doğu Karadeniz",
+    cannot be told apart from a location and apply everywhere.
+    """
+    name = _REGION_SUFFIX.sub("", name)
+    if name in _PROVINCE_KEYS:
+        return (name,)
+    return _REGION_KEYS.get(name, (None,))
+
+
+class AlertIndex:
+    """MGM alerts and MeteoAlarms indexed by the places they apply to.
+
+    The index is built once per fetch. Alerts are keyed by center ID and by
+    province name, regions in MeteoAlarm "bolge" texts are expanded to their
+    provinces. Alerts that do not name any place, or name one that is not
+    a known region or province, apply to every location.
+    """
+
+    __slots__ = ("_buckets", "_items", "_lookups")
+
+    def __init__(
+        self,
+        alerts: Iterable[dict[str, Any]],
+        meteoalarm: Iterable[dict[str, Any]],
+    ) -> None:
+        """Build the index."""
+        # Bucket key -> positions in the alert and MeteoAlarm lists,
+        # None is the bucket of alerts that apply everywhere
+        self._buckets: dict[int | str | None, tuple[list[int], list[int]]] = {}
+        self._lookups: dict[tuple[Any, str], tuple[list[dict[str, Any]], list[dict[str, Any]]]] = {}
+        self._items = (list(alerts), list(meteoalarm))
+
+        for kind, items in enumerate(self._items):
+            for position, item in enumerate(items):
+                for key in self._keys(item):
+                    self._buckets.setdefault(key, ([], []))[kind].append(position)
+
+    @staticmethod
+    def _keys(item: dict[str, Any]) -> set[int | str | None]:
+        """Return the bucket keys of an alert."""
+        keys: set[int | str | None] = set()
+        for field in _CENTER_FIELDS:
+            keys.update(_center_ids(item.get(field)))
+        for field in _PROVINCE_FIELDS + _AREA_FIELDS:
+            for name in _names(item.get(field)):
+                keys.update(_area_provinces(name))
+        return keys or {None}
+
+    def lookup(
+        self, merkez_id: Any, province: str
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Return the alerts and MeteoAlarms that apply to a location.
+
+        Results keep the order of the MGM payload and are cached per location.
+        """
+        lookup_key = (merkez_id, province)
+        if (cached := self._lookups.get(lookup_key)) is not None:
+            return cached
+
+        keys = [None, *_center_ids(merkez_id), turkish_casefold(province)]
+        positions: tuple[set[int], set[int]] = (set(), set())
+        for key in keys:
+            if (bucket := self._buckets.get(key)) is not None:
+                positions[0].update(bucket[0])
+                positions[1].update(bucket[1])
+
+        result = (
+            [self._items[0][position] for position in sorted(positions[0])],
+            [self._items[1][position] for position in sorted(positions[1])],
+        )
+        self._lookups[lookup_key] = result
+        return result
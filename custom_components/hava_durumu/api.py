@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 import logging
+import random
+import time
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 import aiohttp
+from yarl import URL
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
 
 from .const import (
     API_AUTH_TOKEN,
@@ -21,8 +30,21 @@ from .const import (
     ENDPOINT_METEOALARM_TOMORROW,
     ENDPOINT_PROVINCES,
     ENDPOINT_SEARCH,
+    MIN_REFETCH_AGE,
+)
+from .alerts import ALERT_PLACE_FIELDS
+from .circuit import CircuitBreaker
+from .metrics import ApiMetrics
+from .models import (
+    DAILY_FORECAST_DAYS,
+    CurrentConditions,
+    DailyForecast,
+    HourlyForecast,
 )
 
+if TYPE_CHECKING:
+    from .archive import RecordedResponse, ResponseRecorder, ResponseReplay
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -32,12 +54,161 @@ class MGMApiError(Exception):
     pass
 
 
+class MGMServerError(MGMApiError):
+    """Transient MGM API error worth retrying: timeouts, connection errors and 5xx/429."""
+
+
+class MGMClientError(MGMApiError):
+    """Request that could not be sent, for example on a closed connection pool."""
+
+
+# Failed requests are sent again up to MAX_RETRIES times, waiting a random
+# time up to RETRY_BASE_DELAY * 2 ** attempt seconds (at most RETRY_MAX_DELAY)
+MAX_RETRIES = 2
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+
+# Request timeout in seconds until enough latencies were observed. After
+# that the timeout of an endpoint is TIMEOUT_LATENCY_FACTOR times its p99
+# latency, kept between MIN_REQUEST_TIMEOUT and REQUEST_TIMEOUT.
+REQUEST_TIMEOUT = 30.0
+MIN_REQUEST_TIMEOUT = 5.0
+TIMEOUT_LATENCY_FACTOR = 4
+LATENCY_MIN_SAMPLES = 10
+
+# Response bodies of at least this many bytes are decoded in the executor
+DECODE_EXECUTOR_THRESHOLD = 64 * 1024
+
+# Endpoints that may send a second, hedged request when the first is slow
+HEDGED_ENDPOINTS = (ENDPOINT_CURRENT,)
+
+# Fields kept from each MGM payload: the keys read by the records and the
+# alert fields read by the platforms and the alert index
+CURRENT_FIELDS = tuple(CurrentConditions.API_KEYS.values())
+HOURLY_FIELDS = tuple(HourlyForecast.API_KEYS.values())
+DAILY_FIELDS = tuple(
+    f"{key}Gun{day}"
+    for key in DailyForecast.API_KEYS.values()
+    for day in range(DAILY_FORECAST_DAYS)
+)
+ALERT_FIELDS = ("baslik", "aciklama", "tarih", "baslangic", "hadiseCinsi", *ALERT_PLACE_FIELDS)
+METEOALARM_FIELDS = ("seviye", "aciklama", *ALERT_PLACE_FIELDS)
+
+
+def project(data: Any, keys: tuple[str, ...]) -> Any:
+    """Return a payload object, or list of objects, with only the given keys."""
+    if isinstance(data, dict):
+        return {key: data[key] for key in keys if key in data}
+    if isinstance(data, list):
+        return [project(record, keys) for record in data if isinstance(record, dict)]
+    return data
+
+
+def _project_hourly(data: Any) -> Any:
+    """Return an hourly forecast payload with only the used fields of its entries."""
+    if not isinstance(data, list):
+        return data
+    return [
+        {"tahmin": project(record.get("tahmin") or [], HOURLY_FIELDS)}
+        for record in data
+        if isinstance(record, dict)
+    ]
+
+
+# Responses are reduced to the used fields before they are cached, so the
+# client and the coordinators never hold the full payloads. The archive
+# still records what MGM sent.
+PROJECTIONS: dict[str, Callable[[Any], Any]] = {
+    ENDPOINT_CURRENT: lambda data: project(data, CURRENT_FIELDS),
+    ENDPOINT_HOURLY: _project_hourly,
+    ENDPOINT_DAILY: lambda data: project(data, DAILY_FIELDS),
+    ENDPOINT_ALERTS: lambda data: project(data, ALERT_FIELDS),
+    ENDPOINT_METEOALARM_TODAY: lambda data: project(data, METEOALARM_FIELDS),
+    ENDPOINT_METEOALARM_TOMORROW: lambda data: project(data, METEOALARM_FIELDS),
+}
+
+# Endpoint of each location data section
+SECTION_ENDPOINTS = {
+    "current": ENDPOINT_CURRENT,
+    "hourly": ENDPOINT_HOURLY,
+    "daily": ENDPOINT_DAILY,
+}
+
+
+# Parameters that change between otherwise identical requests. Responses
+# for different values of these replace each other in the response cache.
+VOLATILE_PARAMS = ("datetime",)
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Decoded body of a previous response with its cache validators."""
+
+    key: CacheKey
+    data: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    # Monotonic time of the last response, None if it was never fetched live
+    fetched_at: float | None = None
+
+    def is_fresh(self, key: CacheKey, max_age: float) -> bool:
+        """Return True if the response answers key and is younger than max_age."""
+        return (
+            self.key == key
+            and self.fetched_at is not None
+            and time.monotonic() - self.fetched_at < max_age
+        )
+
+
+def _cache_key(endpoint: str, params: dict[str, Any] | None) -> CacheKey:
+    """Return a hashable key for an endpoint and parameter set."""
+    if not params:
+        return endpoint, ()
+    return endpoint, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+
+def _cache_slot(key: CacheKey) -> CacheKey:
+    """Return the cache slot of a key, ignoring volatile parameters."""
+    endpoint, params = key
+    return endpoint, tuple(param for param in params if param[0] not in VOLATILE_PARAMS)
+
+
 class MGMApiClient:
     """MGM API Client."""
 
-    def __init__(self, session: aiohttp.ClientSession) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str | None = None,
+        recorder: ResponseRecorder | None = None,
+        replay: ResponseReplay | None = None,
+        breakers: dict[str, CircuitBreaker] | None = None,
+        hedge_percentile: float | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        base_url points the client at another MGM compatible server, for
+        example the local stand-in used by the benchmarks. With a recorder
+        every response is archived, with a replay archived responses are
+        served and MGM is never contacted. Clients passing the same breakers
+        share the circuit breaker of their host. With hedge_percentile, a
+        request to a hedged endpoint still running after that latency
+        percentile is sent a second time and the first response wins.
+        """
         self._session = session
+        self._base_url = base_url or API_BASE_URL
+        self._recorder = recorder
+        self._replay = replay
+        self._hedge_percentile = hedge_percentile
+        self.metrics = ApiMetrics()
+        host = URL(self._base_url).host or self._base_url
+        if breakers is None:
+            breakers = {}
+        if (breaker := breakers.get(host)) is None:
+            breaker = breakers[host] = CircuitBreaker(host)
+        self.breaker = breaker
         self._headers = {
             "Authorization-token-ios": API_AUTH_TOKEN,
             "Accept": "*/*",
@@ -47,39 +218,286 @@ class MGMApiClient:
             "Cache-Control": "no-cache",
             "Pragma": "no-cache",
         }
+        # Validators and decoded bodies of earlier responses, used to send
+        # conditional requests and to answer 304 responses from memory
+        self._cache: dict[CacheKey, CachedResponse] = {}
+        # Requests on the wire, identical requests wait for the same response
+        self._in_flight: dict[CacheKey, asyncio.Task[Any]] = {}
+        # Endpoints currently answered with the last good response
+        self._stale_endpoints: set[str] = set()
 
     async def _request(
         self, endpoint: str, params: dict[str, Any] | None = None
     ) -> Any:
-        """Make an API request."""
-        url = f"{API_BASE_URL}{endpoint}"
-        
+        """Make an API request.
+
+        Responses younger than the minimum refetch age of the endpoint are
+        served from memory and identical concurrent requests share a single
+        upstream request. When MGM fails, the last good response is served
+        until fresh data arrives.
+        """
+        key = _cache_key(endpoint, params)
+        cached = self._cache.get(_cache_slot(key))
+        if cached is not None and cached.is_fresh(key, MIN_REFETCH_AGE.get(endpoint, 0)):
+            _LOGGER.debug("Serving %s from memory", endpoint)
+            self.metrics.record_cache_hit(endpoint)
+            self._stale_endpoints.discard(endpoint)
+            return cached.data
+
+        if (task := self._in_flight.get(key)) is None:
+            task = asyncio.get_running_loop().create_task(self._fetch(endpoint, params, key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        else:
+            self.metrics.record_coalesced(endpoint)
+        try:
+            # A cancelled caller must not cancel the request for the others
+            data = await asyncio.shield(task)
+        except MGMApiError as err:
+            if cached is None or cached.data is None:
+                raise
+            _LOGGER.warning("Serving last good %s data from memory: %s", endpoint, err)
+            self.metrics.record_stale(endpoint)
+            self._stale_endpoints.add(endpoint)
+            return cached.data
+        self._stale_endpoints.discard(endpoint)
+        return data
+
+    def seed_cache(self, responses: Iterable[RecordedResponse]) -> None:
+        """Prime the response cache with archived responses.
+
+        Seeded responses are never fresh, they only provide validators so the
+        first requests after a cold start can be answered with 304.
+        """
+        for response in responses:
+            slot = _cache_slot(key := response.key)
+            if response.status == 200 and slot not in self._cache:
+                projection = PROJECTIONS.get(key[0])
+                self._cache[slot] = CachedResponse(
+                    key,
+                    projection(response.body) if projection else response.body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+
+    def _request_done(self, key: CacheKey, task: asyncio.Task[Any]) -> None:
+        """Forget a finished request."""
+        self._in_flight.pop(key, None)
+        # Retrieve the error so it is not reported when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def is_stale(self, endpoint: str) -> bool:
+        """Return True if the last request to an endpoint was answered with old data."""
+        return endpoint in self._stale_endpoints
+
+    async def _fetch(
+        self, endpoint: str, params: dict[str, Any] | None, key: CacheKey
+    ) -> Any:
+        """Send a request to MGM, retrying transient failures."""
+        url = f"{self._base_url}{endpoint}"
+        cached = self._cache.get(_cache_slot(key))
+        if cached is not None and cached.key != key:
+            cached = None
+
+        headers = self._headers
+        if cached is not None and (cached.etag or cached.last_modified):
+            headers = dict(self._headers)
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        if self._replay is not None:
+            if (recorded := self._replay.lookup(key)) is None:
+                raise MGMApiError(f"No recorded response for {url}")
+            return self._handle_response(
+                url, key, cached, recorded.status, recorded.headers, recorded.body
+            )
+
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self.metrics.record_rejected(endpoint)
+                raise MGMApiError(
+                    f"MGM API unavailable, retrying in {self.breaker.retry_in:.0f} seconds"
+                )
+            try:
+                data = await self._send_hedged(endpoint, params, key, url, headers, cached)
+            except MGMServerError as err:
+                self.breaker.record_failure()
+                if attempt >= MAX_RETRIES:
+                    _LOGGER.error("API request failed: %s - %s", url, err)
+                    raise
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+                attempt += 1
+                _LOGGER.debug(
+                    "API request failed: %s - %s, retry %d in %.1f seconds",
+                    url,
+                    err,
+                    attempt,
+                    delay,
+                )
+                self.metrics.record_retry(endpoint)
+                await asyncio.sleep(delay)
+            except MGMClientError:
+                # MGM was not asked, the breaker learns nothing
+                raise
+            except MGMApiError:
+                # MGM answered, only this request is wrong
+                self.breaker.record_success()
+                raise
+            else:
+                self.breaker.record_success()
+                return data
+
+    def _timeout(self, endpoint: str) -> float:
+        """Return the request timeout of an endpoint from its observed latency."""
+        metrics = self.metrics.get(endpoint)
+        if metrics.requests < LATENCY_MIN_SAMPLES:
+            return REQUEST_TIMEOUT
+        p99 = (metrics.latency_percentile_ms(0.99) or 0) / 1000
+        return min(max(p99 * TIMEOUT_LATENCY_FACTOR, MIN_REQUEST_TIMEOUT), REQUEST_TIMEOUT)
+
+    def _hedge_delay(self, endpoint: str) -> float | None:
+        """Return the seconds to wait before hedging a request, None to not hedge."""
+        if self._hedge_percentile is None or endpoint not in HEDGED_ENDPOINTS:
+            return None
+        metrics = self.metrics.get(endpoint)
+        if metrics.requests < LATENCY_MIN_SAMPLES:
+            return None
+        return (metrics.latency_percentile_ms(self._hedge_percentile) or 0) / 1000
+
+    async def _send_hedged(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        key: CacheKey,
+        url: str,
+        headers: dict[str, str],
+        cached: CachedResponse | None,
+    ) -> Any:
+        """Send a request, and a second one if the first is slower than usual."""
+        if (delay := self._hedge_delay(endpoint)) is None:
+            return await self._send(endpoint, params, key, url, headers, cached)
+
+        loop = asyncio.get_running_loop()
+        first = loop.create_task(self._send(endpoint, params, key, url, headers, cached))
+        pending: set[asyncio.Task[Any]] = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                _LOGGER.debug("No response from %s after %.2f seconds, hedging", url, delay)
+                self.metrics.record_hedged(endpoint)
+                pending.add(
+                    loop.create_task(self._send(endpoint, params, key, url, headers, cached))
+                )
+            # The first successful response wins, the error of the last
+            # request is raised when both fail
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.metrics.record_hedge_win(endpoint)
+                        return task.result()
+                if not pending:
+                    raise task.exception()  # type: ignore[misc]
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        key: CacheKey,
+        url: str,
+        headers: dict[str, str],
+        cached: CachedResponse | None,
+    ) -> Any:
+        """Send a single request to MGM."""
+        start = time.monotonic()
         try:
             async with self._session.get(
-                url, headers=self._headers, params=params, timeout=30
+                url,
+                headers=headers,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=self._timeout(endpoint)),
             ) as response:
-                if response.status == 304:
-                    _LOGGER.debug("API returned 304 for %s", url)
-                    return None
-                    
-                if response.status != 200:
-                    _LOGGER.error(
-                        "API request failed: %s, status: %s",
-                        url,
-                        response.status,
+                body = await response.read()
+                latency = time.monotonic() - start
+                self.metrics.record_response(endpoint, response.status, latency, len(body))
+                data = await self._decode(url, body) if response.status == 200 else None
+                if self._recorder is not None:
+                    self._recorder.add(
+                        endpoint, params, response.status, response.headers, data
                     )
-                    raise MGMApiError(f"API request failed with status {response.status}")
-                
-                data = await response.json()
-                _LOGGER.debug("API response for %s: %s", url, "success")
-                return data
-                
+                return self._handle_response(
+                    url, key, cached, response.status, response.headers, data
+                )
+
         except asyncio.TimeoutError as err:
-            _LOGGER.error("API request timeout: %s", url)
-            raise MGMApiError("API request timeout") from err
+            self.metrics.record_error(endpoint, time.monotonic() - start, "timeout")
+            raise MGMServerError("API request timeout") from err
         except aiohttp.ClientError as err:
-            _LOGGER.error("API request error: %s - %s", url, str(err))
-            raise MGMApiError(f"API request error: {str(err)}") from err
+            self.metrics.record_error(endpoint, time.monotonic() - start, type(err).__name__)
+            raise MGMServerError(f"API request error: {str(err)}") from err
+        except RuntimeError as err:
+            # aiohttp raises RuntimeError for a closed session
+            self.metrics.record_error(endpoint, time.monotonic() - start, type(err).__name__)
+            raise MGMClientError(f"API request could not be sent: {err}") from err
+
+    async def _decode(self, url: str, body: bytes) -> Any:
+        """Decode a JSON body, off the event loop when it is large."""
+        try:
+            if len(body) < DECODE_EXECUTOR_THRESHOLD:
+                return json_loads(body)
+            return await asyncio.get_running_loop().run_in_executor(None, json_loads, body)
+        except ValueError as err:
+            raise MGMServerError(f"Invalid JSON from {url}: {err}") from err
+
+    def _handle_response(
+        self,
+        url: str,
+        key: CacheKey,
+        cached: CachedResponse | None,
+        status: int,
+        headers: Any,
+        data: Any,
+    ) -> Any:
+        """Return the data of a live or replayed response and update the cache."""
+        if status == 304:
+            _LOGGER.debug("API returned 304 for %s", url)
+            if cached is None:
+                return None
+            cached.fetched_at = time.monotonic()
+            return cached.data
+
+        if status >= 500 or status == 429:
+            raise MGMServerError(f"API request failed with status {status}")
+        if status != 200:
+            _LOGGER.error(
+                "API request failed: %s, status: %s",
+                url,
+                status,
+            )
+            raise MGMApiError(f"API request failed with status {status}")
+
+        _LOGGER.debug("API response for %s: %s", url, "success")
+
+        if (projection := PROJECTIONS.get(key[0])) is not None:
+            data = projection(data)
+        self._cache[_cache_slot(key)] = CachedResponse(
+            key,
+            data,
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+            time.monotonic(),
+        )
+        return data
 
     async def get_provinces(self) -> list[dict[str, Any]]:
         """Get list of all provinces."""
@@ -98,7 +516,7 @@ class MGMApiClient:
             return []
         return result
 
-    async def get_current_weather(self, merkez_id: int) -> dict[str, Any] | None:
+    async def get_current_weather(self, merkez_id: int) -> CurrentConditions | None:
         """Get current weather data for a location."""
         result = await self._request(
             ENDPOINT_CURRENT,
@@ -107,14 +525,15 @@ class MGMApiClient:
         if result is None or not result:
             return None
         # API returns a list, we need the first item
-        return result[0] if isinstance(result, list) else result
+        return CurrentConditions.from_api(result[0] if isinstance(result, list) else result)
 
     async def get_hourly_forecast(
         self, merkez_id: int, datetime_str: str | None = None
-    ) -> list[dict[str, Any]]:
+    ) -> list[HourlyForecast]:
         """Get hourly forecast data."""
         if datetime_str is None:
-            datetime_str = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            # Truncate to the hour so repeated requests share cache validators
+            datetime_str = datetime.utcnow().strftime("%Y-%m-%dT%H:00:00.000Z")
         
         result = await self._request(
             ENDPOINT_HOURLY,
@@ -125,10 +544,12 @@ class MGMApiClient:
         
         # Extract forecast list from response
         if isinstance(result, list) and len(result) > 0:
-            return result[0].get("tahmin", [])
+            return [
+                HourlyForecast.from_api(hour) for hour in result[0].get("tahmin", [])
+            ]
         return []
 
-    async def get_daily_forecast(self, merkez_id: int) -> list[dict[str, Any]]:
+    async def get_daily_forecast(self, merkez_id: int) -> list[DailyForecast]:
         """Get daily forecast data (5 days)."""
         result = await self._request(
             ENDPOINT_DAILY,
@@ -144,20 +565,11 @@ class MGMApiClient:
             forecasts = []
             
             # Process Gun0 through Gun5 (6 days total)
-            for i in range(6):
-                day_data = {
-                    "tarih": raw_data.get(f"tarihGun{i}"),
-                    "enDusuk": raw_data.get(f"enDusukGun{i}"),
-                    "enYuksek": raw_data.get(f"enYuksekGun{i}"),
-                    "hadise": raw_data.get(f"hadiseGun{i}"),
-                    "ruzgarHizi": raw_data.get(f"ruzgarHizGun{i}"),
-                    "ruzgarYonu": raw_data.get(f"ruzgarYonGun{i}"),
-                    "enDusukNem": raw_data.get(f"enDusukNemGun{i}"),
-                    "enYuksekNem": raw_data.get(f"enYuksekNemGun{i}"),
-                }
+            for i in range(DAILY_FORECAST_DAYS):
+                day_data = DailyForecast.from_api(raw_data, i)
                 
                 # Only add if we have valid data
-                if day_data["tarih"]:
+                if day_data.date:
                     forecasts.append(day_data)
             
             return forecasts
@@ -193,42 +605,68 @@ class MGMApiClient:
             return []
         return result
 
+    async def get_location_data(
+        self,
+        merkez_id: int,
+        sections: Iterable[str] = ("current", "hourly", "daily"),
+    ) -> dict[str, Any]:
+        """Get current weather and forecasts for a single location.
+
+        Only the requested sections are fetched and returned.
+        """
+        fetchers = {
+            "current": self.get_current_weather,
+            "hourly": self.get_hourly_forecast,
+            "daily": self.get_daily_forecast,
+        }
+        sections = [section for section in sections if section in fetchers]
+        results = await asyncio.gather(
+            *(fetchers[section](merkez_id) for section in sections),
+            return_exceptions=True,
+        )
+
+        data: dict[str, Any] = {}
+        for section, result in zip(sections, results):
+            # Handle exceptions in gathered results
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to get %s weather data: %s", section, result)
+                result = None if section == "current" else []
+            data[section] = result
+
+        return data
+
+    async def get_alert_data(self) -> dict[str, Any]:
+        """Get nationwide alerts and MeteoAlarm data.
+
+        These payloads are not location specific, so they are fetched once
+        and shared between all configured locations.
+        """
+        alerts, meteoalarm_today = await asyncio.gather(
+            self.get_alerts(),
+            self.get_meteoalarm_today(),
+            return_exceptions=True,
+        )
+
+        if isinstance(alerts, Exception):
+            _LOGGER.warning("Failed to get alerts: %s", alerts)
+            alerts = []
+        if isinstance(meteoalarm_today, Exception):
+            _LOGGER.warning("Failed to get meteoalarm: %s", meteoalarm_today)
+            meteoalarm_today = []
+
+        return {
+            "alerts": alerts,
+            "meteoalarm": meteoalarm_today,
+        }
+
     async def get_all_data(self, merkez_id: int) -> dict[str, Any]:
         """Get all weather data for a location."""
         try:
-            current, hourly, daily, alerts, meteoalarm_today = await asyncio.gather(
-                self.get_current_weather(merkez_id),
-                self.get_hourly_forecast(merkez_id),
-                self.get_daily_forecast(merkez_id),
-                self.get_alerts(),
-                self.get_meteoalarm_today(),
-                return_exceptions=True,
+            location_data, alert_data = await asyncio.gather(
+                self.get_location_data(merkez_id),
+                self.get_alert_data(),
             )
-            
-            # Handle exceptions in gathered results
-            if isinstance(current, Exception):
-                _LOGGER.warning("Failed to get current weather: %s", current)
-                current = None
-            if isinstance(hourly, Exception):
-                _LOGGER.warning("Failed to get hourly forecast: %s", hourly)
-                hourly = []
-            if isinstance(daily, Exception):
-                _LOGGER.warning("Failed to get daily forecast: %s", daily)
-                daily = []
-            if isinstance(alerts, Exception):
-                _LOGGER.warning("Failed to get alerts: %s", alerts)
-                alerts = []
-            if isinstance(meteoalarm_today, Exception):
-                _LOGGER.warning("Failed to get meteoalarm: %s", meteoalarm_today)
-                meteoalarm_today = []
-
-            return {
-                "current": current,
-                "hourly": hourly,
-                "daily": daily,
-                "alerts": alerts,
-                "meteoalarm": meteoalarm_today,
-            }
+            return {**location_data, **alert_data}
         except Exception as err:
             _LOGGER.error("Failed to get all data: %s", err)
             raise MGMApiError(f"Failed to get all data: {str(err)}") from err
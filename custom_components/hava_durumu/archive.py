@@ -0,0 +1,199 @@
+"""Record and replay of MGM API responses.
+
+Archives are gzip compressed JSON lines files, one response per line:
+
+    {"t": 1760695200.0, "e": "/sondurumlar", "p": {"merkezid": "90601"},
+     "s": 200, "h": {"ETag": "..."}, "b": [...]}
+
+Each flush appends a gzip member, gzip readers see one continuous stream.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import gzip
+import json
+import logging
+import time
+from typing import Any
+
+from .api import CacheKey, _cache_key, _cache_slot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Response headers kept in the archive
+RECORDED_HEADERS = ("ETag", "Last-Modified")
+
+# Buffered responses are written to disk after this many seconds
+FLUSH_DELAY = 5
+
+
+@dataclass(slots=True)
+class RecordedResponse:
+    """One archived response."""
+
+    endpoint: str
+    params: dict[str, str]
+    status: int
+    headers: dict[str, str]
+    body: Any
+    timestamp: float = 0.0
+
+    def as_line(self) -> str:
+        """Return the archive line of the response."""
+        return json.dumps(
+            {
+                "t": self.timestamp,
+                "e": self.endpoint,
+                "p": self.params,
+                "s": self.status,
+                "h": self.headers,
+                "b": self.body,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> RecordedResponse:
+        """Create the response from an archive line."""
+        raw = json.loads(line)
+        return cls(
+            raw["e"],
+            raw.get("p") or {},
+            raw["s"],
+            raw.get("h") or {},
+            raw.get("b"),
+            raw.get("t", 0.0),
+        )
+
+    @property
+    def key(self) -> CacheKey:
+        """Return the request key of the response."""
+        return _cache_key(self.endpoint, self.params)
+
+
+def read_archive(path: str) -> list[RecordedResponse]:
+    """Read every response of an archive, skipping a truncated last line."""
+    responses = []
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        try:
+            for line in file:
+                if line.strip():
+                    responses.append(RecordedResponse.from_line(line))
+        except (EOFError, json.JSONDecodeError) as err:
+            _LOGGER.warning("Archive %s ends with an incomplete record: %s", path, err)
+    return responses
+
+
+class ResponseRecorder:
+    """Append every MGM response to an archive.
+
+    Responses are buffered and written in the executor so the event loop
+    never touches the disk.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self._buffer: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._write_lock = asyncio.Lock()
+
+    def add(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        status: int,
+        headers: Any,
+        body: Any,
+    ) -> None:
+        """Buffer a response and schedule a write."""
+        response = RecordedResponse(
+            endpoint,
+            {key: str(value) for key, value in (params or {}).items()},
+            status,
+            {name: headers[name] for name in RECORDED_HEADERS if name in headers},
+            body,
+            time.time(),
+        )
+        self._buffer.append(response.as_line())
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(
+                FLUSH_DELAY, lambda: loop.create_task(self.async_flush())
+            )
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the archive."""
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    async def async_flush(self) -> None:
+        """Write the buffered responses."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        async with self._write_lock:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._write, lines)
+            except OSError as err:
+                _LOGGER.error("Could not write MGM responses to %s: %s", self.path, err)
+
+
+class ResponseReplay:
+    """Serve archived responses instead of calling MGM.
+
+    Responses to the same request are replayed in recorded order, the last
+    one is repeated once the recording is exhausted. Requests that differ
+    only in volatile parameters (the hourly forecast time) fall back to the
+    responses recorded for the other values.
+    """
+
+    def __init__(self, responses: list[RecordedResponse]) -> None:
+        """Index the archived responses."""
+        self._by_key: dict[CacheKey, list[RecordedResponse]] = {}
+        self._by_slot: dict[CacheKey, list[RecordedResponse]] = {}
+        self._positions: dict[CacheKey, int] = {}
+        for response in responses:
+            key = response.key
+            self._by_key.setdefault(key, []).append(response)
+            self._by_slot.setdefault(_cache_slot(key), []).append(response)
+
+    def __len__(self) -> int:
+        """Return the number of archived requests."""
+        return len(self._by_key)
+
+    def lookup(self, key: CacheKey) -> RecordedResponse | None:
+        """Return the next archived response for a request."""
+        if (responses := self._by_key.get(key)) is None:
+            key = _cache_slot(key)
+            if (responses := self._by_slot.get(key)) is None:
+                return None
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        return responses[min(position, len(responses) - 1)]
+
+    def latest(self) -> list[RecordedResponse]:
+        """Return the last successful archived response of every request."""
+        latest = []
+        for responses in self._by_key.values():
+            for response in reversed(responses):
+                if response.status == 200:
+                    latest.append(response)
+                    break
+        return latest
+
+
+def group_by_location(
+    responses: list[RecordedResponse],
+) -> dict[str | None, list[RecordedResponse]]:
+    """Group responses by the location they belong to, None for nationwide data."""
+    groups: dict[str | None, list[RecordedResponse]] = {}
+    for response in responses:
+        location = response.params.get("merkezid") or response.params.get("istno")
+        groups.setdefault(location, []).append(response)
+    return groups
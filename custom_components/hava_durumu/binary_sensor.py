@@ -15,6 +15,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN
 from .coordinator import HavaDurumuDataUpdateCoordinator
+from .entity import SectionUpdateMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ async def async_setup_entry(
 
 
 class HavaDurumuAlertSensor(
-    CoordinatorEntity[HavaDurumuDataUpdateCoordinator], BinarySensorEntity
+    SectionUpdateMixin, CoordinatorEntity[HavaDurumuDataUpdateCoordinator], BinarySensorEntity
 ):
     """Binary sensor for active weather alerts."""
 
@@ -38,6 +39,7 @@ class HavaDurumuAlertSensor(
     _attr_translation_key = "weather_alert"
     _attr_attribution = ATTRIBUTION
     _previous_alert_count: int = 0
+    _data_sections = ("alerts", "meteoalarm")
 
     def __init__(
         self,
@@ -107,7 +109,9 @@ class HavaDurumuAlertSensor(
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        super()._handle_coordinator_update()
+        if not self._inputs_changed():
+            return
+        self.async_write_ha_state()
         
         # Check for new alerts and create notifications
         if self.coordinator.data:
@@ -12,6 +12,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN
 from .coordinator import HavaDurumuDataUpdateCoordinator
+from .entity import SectionUpdateMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +28,7 @@ async def async_setup_entry(
 
 
 class HavaDurumuRefreshButton(
-    CoordinatorEntity[HavaDurumuDataUpdateCoordinator], ButtonEntity
+    SectionUpdateMixin, CoordinatorEntity[HavaDurumuDataUpdateCoordinator], ButtonEntity
 ):
     """Button to manually refresh weather data."""
 
@@ -54,4 +55,8 @@ class HavaDurumuRefreshButton(
     async def async_press(self) -> None:
         """Handle the button press - refresh all data."""
         _LOGGER.debug("Manuel güncelleme başlatıldı")
+        # Repeated presses are debounced by the coordinators and data that
+        # was fetched moments ago is served from the API client's memory
+        self.coordinator.async_mark_all_due()
+        await self.coordinator.alerts_coordinator.async_request_refresh()
         await self.coordinator.async_request_refresh()
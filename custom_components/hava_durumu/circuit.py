@@ -0,0 +1,107 @@
+"""Circuit breaker for the MGM API."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Consecutive failed requests that open the circuit
+FAILURE_THRESHOLD = 5
+
+# Seconds the circuit stays open, doubled after every failed probe
+RESET_TIMEOUT = 60.0
+MAX_RESET_TIMEOUT = 600.0
+
+
+class CircuitBreaker:
+    """Stop contacting a host while it keeps failing.
+
+    After FAILURE_THRESHOLD failures in a row the circuit opens and requests
+    fail immediately. Once the reset timeout has passed a single probe
+    request is let through, its success closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        # Start of the probe request while half open, a probe that never
+        # reports back is replaced after the reset timeout
+        self._probe_started: float | None = None
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent to the host."""
+        if self.state == STATE_CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == STATE_OPEN:
+            if now - self.opened_at < self.reset_timeout:
+                return False
+            self.state = STATE_HALF_OPEN
+        if (
+            self._probe_started is not None
+            and now - self._probe_started < self.reset_timeout
+        ):
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a request reached the host."""
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("MGM API at %s is reachable again", self.host)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.reset_timeout = self.base_reset_timeout
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit when needed."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, MAX_RESET_TIMEOUT)
+        elif self.state == STATE_OPEN or self.failures < self.failure_threshold:
+            return
+        else:
+            _LOGGER.warning(
+                "MGM API at %s failed %d times in a row, pausing requests for %d seconds",
+                self.host,
+                self.failures,
+                self.reset_timeout,
+            )
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self._probe_started = None
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(self.reset_timeout - (time.monotonic() - self.opened_at), 0.0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state for diagnostics."""
+        return {
+            "host": self.host,
+            "state": self.state,
+            "failures": self.failures,
+            "reset_timeout": self.reset_timeout,
+            "retry_in": round(self.retry_in, 1),
+        }
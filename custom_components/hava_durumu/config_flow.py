@@ -7,12 +7,34 @@ from typing import Any
 import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.const import CONF_LATITUDE, CONF_LOCATION, CONF_LONGITUDE
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
 
-from .api import MGMApiClient, MGMApiError
-from .const import CONF_DISTRICT, CONF_MERKEZ_ID, CONF_PROVINCE, DOMAIN
+from .api import MGMApiError
+from .const import (
+    ALERTS_UPDATE_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ALERTS_INTERVAL,
+    CONF_BATCH_MODE,
+    CONF_DAILY_INTERVAL,
+    CONF_DISTRICT,
+    CONF_HEDGE_PERCENTILE,
+    CONF_HOURLY_INTERVAL,
+    CONF_MERKEZ_ID,
+    CONF_NEIGHBOR_FALLBACK,
+    CONF_PROVINCE,
+    CONF_QUERY,
+    CONF_UPDATE_INTERVAL,
+    DAILY_UPDATE_INTERVAL,
+    DOMAIN,
+    HOURLY_UPDATE_INTERVAL,
+    MAX_LOCATION_DISTANCE_KM,
+    UPDATE_INTERVAL,
+)
+from .coordinator import create_api_client
+from .locations import LocationIndex, async_get_location_cache, location_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,8 +43,7 @@ async def validate_location(
     hass: HomeAssistant, merkez_id: int
 ) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    session = async_get_clientsession(hass)
-    client = MGMApiClient(session)
+    client = create_api_client(hass, merkez_id)
     
     try:
         current = await client.get_current_weather(merkez_id)
@@ -41,55 +62,51 @@ class HavaDurumuConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._provinces: list[str] = []
-        self._districts: list[dict[str, Any]] = []
+        self._index: LocationIndex | None = None
+        self._districts: list[str] = []
         self._selected_province: str | None = None
+        self._matches: dict[str, dict[str, Any]] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step - province selection."""
+        """Handle the initial step - choose how to find the location."""
+        return self.async_show_menu(step_id="user", menu_options=["province", "search", "coordinates"])
+
+    async def async_step_province(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle province selection."""
         errors: dict[str, str] = {}
+        locations = async_get_location_cache(self.hass)
 
-        if not self._provinces:
-            try:
-                session = async_get_clientsession(self.hass)
-                client = MGMApiClient(session)
-                # Get only province centers for initial list
-                all_locations = await client.get_provinces()
-                
-                # Extract unique provinces
-                provinces_set = set()
-                for location in all_locations:
-                    il = location.get("il", "")
-                    if il:
-                        provinces_set.add(il)
-                
-                self._provinces = sorted(list(provinces_set))
-            except MGMApiError:
-                errors["base"] = "cannot_connect"
-                return self.async_show_form(
-                    step_id="user",
-                    data_schema=vol.Schema({}),
-                    errors=errors,
-                )
+        # Provinces and districts come from the local location index, MGM is
+        # only asked when nothing has been stored yet
+        try:
+            self._index = await locations.async_get_index()
+        except MGMApiError:
+            errors["base"] = "cannot_connect"
+            return self.async_show_form(
+                step_id="province",
+                data_schema=vol.Schema({}),
+                errors=errors,
+            )
+        provinces = self._index.provinces()
 
         if user_input is not None:
-            province_name = user_input[CONF_PROVINCE]
+            province_name = self._index.province(user_input[CONF_PROVINCE])
             
-            if province_name in self._provinces:
+            if province_name is not None:
                 self._selected_province = province_name
-                # Fetch all districts for the selected province
                 try:
-                    session = async_get_clientsession(self.hass)
-                    client = MGMApiClient(session)
-                    self._districts = await client.search_locations(province_name, limit=100)
+                    self._districts = await locations.async_get_districts(province_name)
+                    self._index = locations.index
                 except MGMApiError:
                     errors["base"] = "cannot_connect"
                     return self.async_show_form(
-                        step_id="user",
+                        step_id="province",
                         data_schema=vol.Schema({
-                            vol.Required(CONF_PROVINCE): vol.In(self._provinces),
+                            vol.Required(CONF_PROVINCE): vol.In(provinces),
                         }),
                         errors=errors,
                     )
@@ -99,10 +116,10 @@ class HavaDurumuConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "invalid_province"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="province",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_PROVINCE): vol.In(self._provinces),
+                    vol.Required(CONF_PROVINCE): vol.In(provinces),
                 }
             ),
             errors=errors,
@@ -119,51 +136,167 @@ class HavaDurumuConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             # Find the selected district
             selected_district = None
-            for district in self._districts:
-                if district.get("ilce") == district_name:
-                    selected_district = district
-                    break
+            if self._index is not None and self._selected_province:
+                selected_district = self._index.location(self._selected_province, district_name)
             
             if selected_district:
-                merkez_id = selected_district.get("merkezId")
-                
-                if merkez_id:
-                    # Check for existing entry with same merkez_id
-                    await self.async_set_unique_id(f"{merkez_id}")
-                    self._abort_if_unique_id_configured()
-                    
-                    try:
-                        await validate_location(self.hass, merkez_id)
-                    except (MGMApiError, ValueError):
-                        errors["base"] = "cannot_connect"
-                    else:
-                        return self.async_create_entry(
-                            title=f"{district_name}, {self._selected_province}",
-                            data={
-                                CONF_PROVINCE: self._selected_province,
-                                CONF_DISTRICT: district_name,
-                                CONF_MERKEZ_ID: merkez_id,
-                            },
-                        )
+                if selected_district.get("merkezId"):
+                    if (result := await self._async_create_location_entry(selected_district)) is not None:
+                        return result
+                    errors["base"] = "cannot_connect"
                 else:
                     errors["base"] = "invalid_district"
             else:
                 errors["base"] = "invalid_district"
 
-        # Create district selection dropdown
-        district_names = sorted([d.get("ilce", "") for d in self._districts])
-        
         return self.async_show_form(
             step_id="district",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_DISTRICT): vol.In(district_names),
+                    vol.Required(CONF_DISTRICT): vol.In(self._districts),
                 }
             ),
             errors=errors,
             description_placeholders={"province": self._selected_province},
         )
 
+    async def async_step_search(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle finding a district by the start of its name."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                index = await async_get_location_cache(self.hass).async_get_full_index()
+            except MGMApiError:
+                errors["base"] = "cannot_connect"
+            else:
+                if matches := index.search(user_input[CONF_QUERY]):
+                    self._matches = {str(location["merkezId"]): location for location in matches}
+                    return await self.async_step_search_result()
+                errors["base"] = "no_matching_location"
+
+        return self.async_show_form(
+            step_id="search",
+            data_schema=vol.Schema({vol.Required(CONF_QUERY): str}),
+            errors=errors,
+        )
+
+    async def async_step_search_result(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle picking one of the search matches."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            location = self._matches.get(user_input[CONF_LOCATION])
+            if location is None:
+                errors["base"] = "invalid_district"
+            elif (result := await self._async_create_location_entry(location)) is not None:
+                return result
+            else:
+                errors["base"] = "cannot_connect"
+
+        return self.async_show_form(
+            step_id="search_result",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_LOCATION): vol.In(
+                        {key: location_name(location) for key, location in self._matches.items()}
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_coordinates(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle picking the location nearest to coordinates, Home by default."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                location = await self._async_nearest_location(
+                    user_input[CONF_LATITUDE], user_input[CONF_LONGITUDE]
+                )
+            except MGMApiError:
+                errors["base"] = "cannot_connect"
+            else:
+                if location is None:
+                    errors["base"] = "no_nearby_location"
+                elif (result := await self._async_create_location_entry(location)) is not None:
+                    return result
+                else:
+                    errors["base"] = "cannot_connect"
+
+        return self.async_show_form(
+            step_id="coordinates",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_LATITUDE, default=self.hass.config.latitude): cv.latitude,
+                    vol.Required(CONF_LONGITUDE, default=self.hass.config.longitude): cv.longitude,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Add the location nearest to coordinates from configuration.yaml.
+
+        The location comes from the local location list, so importing many
+        locations sends no search or validation requests.
+        """
+        try:
+            location = await self._async_nearest_location(
+                import_data[CONF_LATITUDE], import_data[CONF_LONGITUDE]
+            )
+        except MGMApiError:
+            return self.async_abort(reason="cannot_connect")
+        if location is None:
+            return self.async_abort(reason="no_nearby_location")
+        return await self._async_create_entry_for(location)
+
+    async def _async_nearest_location(
+        self, latitude: float, longitude: float
+    ) -> dict[str, Any] | None:
+        """Return the MGM location nearest to a coordinate, None if none is close."""
+        index = await async_get_location_cache(self.hass).async_get_full_index()
+        nearest = index.stations.nearest_to(latitude, longitude)
+        if not nearest or nearest[0][1] > MAX_LOCATION_DISTANCE_KM:
+            return None
+        return nearest[0][0]
+
+    async def _async_create_location_entry(
+        self, location: dict[str, Any]
+    ) -> FlowResult | None:
+        """Create the entry of a location, None if MGM has no data for it."""
+        # Check for existing entry with same merkez_id
+        await self.async_set_unique_id(f"{location['merkezId']}")
+        self._abort_if_unique_id_configured()
+
+        try:
+            await validate_location(self.hass, location["merkezId"])
+        except (MGMApiError, ValueError):
+            return None
+        return await self._async_create_entry_for(location)
+
+    async def _async_create_entry_for(self, location: dict[str, Any]) -> FlowResult:
+        """Create the entry of a location without asking MGM."""
+        merkez_id = location["merkezId"]
+        await self.async_set_unique_id(f"{merkez_id}")
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(
+            title=location_name(location),
+            data={
+                CONF_PROVINCE: location["il"],
+                CONF_DISTRICT: location.get("ilce") or "",
+                CONF_MERKEZ_ID: merkez_id,
+            },
+        )
+
     @staticmethod
     def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
         """Get the options flow for this handler."""
@@ -189,8 +322,44 @@ class HavaDurumuOptionsFlow(config_entries.OptionsFlow):
             data_schema=vol.Schema(
                 {
                     vol.Required(
-                        "update_interval",
-                        default=int(self._config_entry.options.get("update_interval", 1800)),
+                        CONF_UPDATE_INTERVAL,
+                        default=int(self._config_entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL)),
+                    ): vol.In(
+                        {
+                            300: "5 dakika",
+                            600: "10 dakika",
+                            900: "15 dakika",
+                            1800: "30 dakika",
+                            3600: "60 dakika",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self._config_entry.options.get(CONF_ADAPTIVE_POLLING, True),
+                    ): bool,
+                    vol.Required(
+                        CONF_HOURLY_INTERVAL,
+                        default=int(self._config_entry.options.get(CONF_HOURLY_INTERVAL, HOURLY_UPDATE_INTERVAL)),
+                    ): vol.In(
+                        {
+                            1800: "30 dakika",
+                            3600: "1 saat",
+                            10800: "3 saat",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_DAILY_INTERVAL,
+                        default=int(self._config_entry.options.get(CONF_DAILY_INTERVAL, DAILY_UPDATE_INTERVAL)),
+                    ): vol.In(
+                        {
+                            3600: "1 saat",
+                            10800: "3 saat",
+                            21600: "6 saat",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_ALERTS_INTERVAL,
+                        default=int(self._config_entry.options.get(CONF_ALERTS_INTERVAL, ALERTS_UPDATE_INTERVAL)),
                     ): vol.In(
                         {
                             300: "5 dakika",
@@ -200,6 +369,25 @@ class HavaDurumuOptionsFlow(config_entries.OptionsFlow):
                             3600: "60 dakika",
                         }
                     ),
+                    vol.Required(
+                        CONF_BATCH_MODE,
+                        default=self._config_entry.options.get(CONF_BATCH_MODE, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_NEIGHBOR_FALLBACK,
+                        default=self._config_entry.options.get(CONF_NEIGHBOR_FALLBACK, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_HEDGE_PERCENTILE,
+                        default=int(self._config_entry.options.get(CONF_HEDGE_PERCENTILE, 0)),
+                    ): vol.In(
+                        {
+                            0: "Kapalı",
+                            90: "%90 gecikmede",
+                            95: "%95 gecikmede",
+                            99: "%99 gecikmede",
+                        }
+                    ),
                     vol.Required(
                         "enable_notifications",
                         default=self._config_entry.options.get("enable_notifications", True),
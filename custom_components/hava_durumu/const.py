@@ -28,6 +28,31 @@ API_USER_AGENT = "Meteoroloji/6.1.2 (com.mgm.Hava-Durumu; build:1; iOS 26.2.1) A
 # Update interval in seconds (30 minutes)
 UPDATE_INTERVAL = 1800
 
+# Per-endpoint update intervals in seconds
+HOURLY_UPDATE_INTERVAL = 3600
+DAILY_UPDATE_INTERVAL = 10800
+ALERTS_UPDATE_INTERVAL = 1800
+
+# Bounds in seconds of the adaptive current conditions refresh
+ADAPTIVE_MIN_INTERVAL = 300
+ADAPTIVE_MAX_INTERVAL = 7200
+
+# Locations refreshing at the same time, across all config entries
+MAX_CONCURRENT_REFRESHES = 4
+
+# Seconds a batch refresh of all locations may take, locations not fetched
+# by then are left for the next batch
+BATCH_REFRESH_BUDGET = 300
+
+# Connection pool of the MGM API: connections per host, seconds DNS
+# lookups are cached and seconds idle connections are kept alive
+MGM_CONNECTIONS_PER_HOST = 8
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+# Value MGM reports for fields a station does not measure
+MISSING_VALUE = -9999
+
 # API Endpoints
 ENDPOINT_PROVINCES = "/merkezler/iller"
 ENDPOINT_SEARCH = "/merkezler"
@@ -39,12 +64,63 @@ ENDPOINT_ALERT_DETAIL = "/alarmlar/detay"
 ENDPOINT_METEOALARM_TODAY = "/meteoalarm/today"
 ENDPOINT_METEOALARM_TOMORROW = "/meteoalarm/tomorrow"
 
+# Minimum age in seconds before an endpoint is fetched again, earlier
+# requests (refresh button, several refreshes at once) are served from memory
+MIN_REFETCH_AGE = {
+    ENDPOINT_CURRENT: 60,
+    ENDPOINT_HOURLY: 300,
+    ENDPOINT_DAILY: 600,
+    ENDPOINT_ALERTS: 60,
+    ENDPOINT_METEOALARM_TODAY: 60,
+    ENDPOINT_METEOALARM_TOMORROW: 60,
+}
+
 # Configuration keys
 CONF_PROVINCE = "province"
 CONF_DISTRICT = "district"
+CONF_QUERY = "query"
 CONF_MERKEZ_ID = "merkez_id"
 CONF_STATION_ID = "station_id"
 CONF_ENABLE_NOTIFICATIONS = "enable_notifications"
+CONF_UPDATE_INTERVAL = "update_interval"
+CONF_HOURLY_INTERVAL = "hourly_interval"
+CONF_DAILY_INTERVAL = "daily_interval"
+CONF_ALERTS_INTERVAL = "alerts_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_HEDGE_PERCENTILE = "hedge_percentile"
+CONF_BATCH_MODE = "batch_mode"
+CONF_NEIGHBOR_FALLBACK = "neighbor_fallback"
+
+# configuration.yaml keys for recording and replaying MGM responses and
+# for locations imported by coordinates
+CONF_RECORD = "record"
+CONF_REPLAY = "replay"
+CONF_LOCATIONS = "locations"
+
+# Storage for the last good dataset of each config entry
+STORAGE_VERSION = 1
+STORAGE_KEY_SNAPSHOT = f"{DOMAIN}.snapshot"
+SNAPSHOT_SAVE_DELAY = 60
+
+# Local copy of the MGM province and district list used by the config flow
+STORAGE_KEY_LOCATIONS = f"{DOMAIN}.locations"
+LOCATIONS_REFRESH_INTERVAL = 30 * 24 * 3600
+
+# Farthest MGM location in km that is added for a coordinate
+MAX_LOCATION_DISTANCE_KM = 100
+
+# Keys for integration-wide objects shared by all config entries
+DATA_ALERTS_COORDINATOR = "alerts_coordinator"
+DATA_BATCH_COORDINATOR = "batch_coordinator"
+DATA_CIRCUIT_BREAKERS = "circuit_breakers"
+DATA_REFRESH_SCHEDULER = "refresh_scheduler"
+DATA_SESSION = "session"
+DATA_SESSION_UNSUB = "session_unsub"
+DATA_LOCATIONS = "locations"
+DATA_NEIGHBORS = "neighbors"
+DATA_RECORDER = "recorder"
+DATA_REPLAY = "replay"
+DATA_WARM_RESPONSES = "warm_responses"
 
 # Platforms
 PLATFORMS = ["weather", "sensor", "binary_sensor"]
@@ -1,72 +1,650 @@
 """Data update coordinator for Hava Durumu."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 import logging
-from datetime import timedelta
-from typing import Any
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.config_entries import ConfigEntry, current_entry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util, ssl as ssl_util
 
-from .api import MGMApiClient, MGMApiError
-from .const import CONF_MERKEZ_ID, DOMAIN, UPDATE_INTERVAL
+from .alerts import AlertIndex
+from .api import SECTION_ENDPOINTS, MGMApiClient, MGMApiError
+from .const import (
+    ALERTS_UPDATE_INTERVAL,
+    BATCH_REFRESH_BUDGET,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ALERTS_INTERVAL,
+    CONF_DAILY_INTERVAL,
+    CONF_HEDGE_PERCENTILE,
+    CONF_HOURLY_INTERVAL,
+    CONF_MERKEZ_ID,
+    CONF_UPDATE_INTERVAL,
+    DAILY_UPDATE_INTERVAL,
+    DATA_CIRCUIT_BREAKERS,
+    DATA_LOCATIONS,
+    DATA_NEIGHBORS,
+    DATA_RECORDER,
+    DATA_REPLAY,
+    DATA_SESSION,
+    DATA_SESSION_UNSUB,
+    DATA_WARM_RESPONSES,
+    DNS_CACHE_TTL,
+    DOMAIN,
+    HOURLY_UPDATE_INTERVAL,
+    KEEPALIVE_TIMEOUT,
+    MGM_CONNECTIONS_PER_HOST,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY_SNAPSHOT,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+)
+from .models import CurrentConditions, DailyForecast, HourlyForecast
+from .precipitation import PrecipitationIndex
+from .scheduler import AdaptiveScheduler, RefreshScheduler, stagger_fraction
+from .trends import TrendTracker
+
+if TYPE_CHECKING:
+    from .neighbors import NeighborLookup
 
 _LOGGER = logging.getLogger(__name__)
 
+# Scheduled refreshes may fire slightly early; treat sections due within
+# this window as due so they are not pushed back by a whole interval.
+DUE_TOLERANCE = timedelta(seconds=5)
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the connection pool used for every MGM request.
+
+    MGM traffic has its own connector, so all locations reuse a few
+    kept-alive TLS connections with cached DNS lookups and do not compete
+    with the connection limits of other integrations. The pool is closed
+    with the last config entry or when Home Assistant closes.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (session := domain_data.get(DATA_SESSION)) is not None:
+        return session
+
+    session = domain_data[DATA_SESSION] = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit_per_host=MGM_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ssl=ssl_util.get_default_context(),
+        )
+    )
+
+    async def _async_close_session(event: Event) -> None:
+        """Close the pool when Home Assistant closes."""
+        domain_data.pop(DATA_SESSION_UNSUB, None)
+        await async_close_session(hass)
+
+    domain_data[DATA_SESSION_UNSUB] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+    )
+    return session
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close the MGM connection pool and drop the clients bound to it."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (unsub := domain_data.pop(DATA_SESSION_UNSUB, None)) is not None:
+        unsub()
+    # Shared helpers holding a client are created again with the next pool
+    domain_data.pop(DATA_LOCATIONS, None)
+    domain_data.pop(DATA_NEIGHBORS, None)
+    if (session := domain_data.pop(DATA_SESSION, None)) is not None:
+        await session.close()
+
+
+def create_api_client(
+    hass: HomeAssistant, location: Any = None, hedge_percentile: float | None = None
+) -> MGMApiClient:
+    """Return an API client that honors the record and replay settings.
+
+    With a recording configured, the client is primed with the last recorded
+    responses of the location (None for nationwide data). All clients share
+    one circuit breaker per MGM host.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = MGMApiClient(
+        async_get_session(hass),
+        recorder=domain_data.get(DATA_RECORDER),
+        replay=domain_data.get(DATA_REPLAY),
+        breakers=domain_data.setdefault(DATA_CIRCUIT_BREAKERS, {}),
+        hedge_percentile=hedge_percentile,
+    )
+    if warm_responses := domain_data.get(DATA_WARM_RESPONSES):
+        client.seed_cache(warm_responses.get(None if location is None else str(location), []))
+    return client
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the last good dataset of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_SNAPSHOT}.{entry_id}")
+
+
+@contextmanager
+def _without_config_entry() -> Iterator[None]:
+    """Create shared coordinators outside the config entry being set up.
+
+    DataUpdateCoordinator binds to the entry of the current context unless
+    one is passed, which older Home Assistant versions do not accept, and
+    would shut down with it. Shared coordinators belong to no entry.
+    """
+    token = current_entry.set(None)
+    try:
+        yield
+    finally:
+        current_entry.reset(token)
+
+
+class HavaDurumuAlertsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Class to manage fetching nationwide alerts shared by all locations."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the alerts coordinator."""
+        self.api = create_api_client(hass)
+        self._first_refresh: asyncio.Task[None] | None = None
+
+        with _without_config_entry():
+            super().__init__(
+                hass,
+                _LOGGER,
+                name=f"{DOMAIN}_alerts",
+                update_interval=timedelta(seconds=ALERTS_UPDATE_INTERVAL),
+            )
+
+    @callback
+    def async_update_interval_from_entries(self) -> None:
+        """Use the shortest alert interval requested by any config entry."""
+        intervals = [
+            int(entry.options.get(CONF_ALERTS_INTERVAL, ALERTS_UPDATE_INTERVAL))
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+        ]
+        self.update_interval = timedelta(
+            seconds=min(intervals, default=ALERTS_UPDATE_INTERVAL)
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch alerts and MeteoAlarm data from MGM API."""
+        _LOGGER.debug("Fetching MGM alert data (interval: %s)", self.update_interval)
+        try:
+            alert_data = await self.api.get_alert_data()
+        except MGMApiError as err:
+            raise UpdateFailed(f"Error fetching MGM alerts: {err}") from err
+        except Exception as err:
+            _LOGGER.exception("Unexpected error fetching MGM alerts")
+            raise UpdateFailed(f"Unexpected error: {err}") from err
+
+        # Index once per fetch so every location looks up its own alerts
+        alert_data["index"] = AlertIndex(alert_data["alerts"], alert_data["meteoalarm"])
+        return alert_data
+
+    async def async_ensure_data(self) -> None:
+        """Fetch alerts once, even when several entries set up concurrently."""
+        if self.data is not None:
+            return
+        if self._first_refresh is None or self._first_refresh.done():
+            self._first_refresh = self.hass.async_create_task(self.async_refresh())
+        await asyncio.shield(self._first_refresh)
+
+
+class HavaDurumuBatchCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Class to refresh the locations in batch mode through one pipeline.
+
+    Instead of a timer per config entry, the batch wakes up when the first
+    location becomes due and fetches every due location, the longest
+    waiting first, through the shared refresh limit. The results are keyed
+    by entry ID and taken over by the coordinator of each location.
+    Locations not fetched within BATCH_REFRESH_BUDGET are left for the next
+    batch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the batch coordinator."""
+        self.members: dict[str, HavaDurumuDataUpdateCoordinator] = {}
+        # Next try of locations left over by the last batch: right away when
+        # the batch ran out of time, one interval later when the fetch failed
+        self._retry_at: dict[str, datetime] = {}
+        # Seconds the last batch took and the locations it fetched
+        self.last_duration: float | None = None
+        self.last_size = 0
+
+        with _without_config_entry():
+            super().__init__(
+                hass,
+                _LOGGER,
+                name=f"{DOMAIN}_batch",
+                update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            )
+
+    @callback
+    def async_add_member(self, coordinator: HavaDurumuDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Refresh a location with the batch until the returned callback is called."""
+        entry_id = coordinator.entry.entry_id
+        self.members[entry_id] = coordinator
+        remove_listener = self.async_add_listener(coordinator.async_handle_batch_update)
+        self._schedule_next_batch(dt_util.utcnow())
+        self._schedule_refresh()
+
+        @callback
+        def remove_member() -> None:
+            """Stop refreshing the location."""
+            self.members.pop(entry_id, None)
+            self._retry_at.pop(entry_id, None)
+            remove_listener()
+
+        return remove_member
+
+    def _next_wakeup(self, entry_id: str, now: datetime) -> datetime:
+        """Return when a location should be fetched next."""
+        if (retry_at := self._retry_at.get(entry_id)) is not None:
+            return retry_at
+        return self.members[entry_id].next_wakeup(now)
+
+    def _schedule_next_batch(self, now: datetime) -> None:
+        """Wake up again when the next location becomes due."""
+        next_batch = min(
+            (self._next_wakeup(entry_id, now) for entry_id in self.members),
+            default=now + timedelta(seconds=UPDATE_INTERVAL),
+        )
+        self.update_interval = max(next_batch - now, DUE_TOLERANCE)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch every due location and collect the results by entry ID."""
+        now = dt_util.utcnow()
+        due = sorted(
+            (
+                entry_id
+                for entry_id, member in self.members.items()
+                if member.is_due(now)
+                and self._retry_at.get(entry_id, now) <= now
+            ),
+            key=lambda entry_id: self._next_wakeup(entry_id, now),
+        )
+        _LOGGER.debug("Fetching MGM weather data for %d locations in a batch", len(due))
+
+        # The shared refresh limit keeps the creation order, so the
+        # locations that waited longest are fetched first
+        started = time.monotonic()
+        tasks = {
+            entry_id: self.hass.async_create_task(
+                self.members[entry_id].async_fetch_for_batch(),
+                f"{DOMAIN}_batch_{entry_id}",
+            )
+            for entry_id in due
+        }
+        pending: set[asyncio.Task[Any]] = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=BATCH_REFRESH_BUDGET)
+        for entry_id, task in tasks.items():
+            if task in pending:
+                task.cancel()
+                if entry_id in self.members:
+                    self._retry_at[entry_id] = now
+        if pending:
+            await asyncio.wait(pending)
+            _LOGGER.warning(
+                "Batch refresh exceeded %d seconds, %d of %d locations are fetched in the next batch",
+                BATCH_REFRESH_BUDGET,
+                len(pending),
+                len(tasks),
+            )
+
+        results: dict[str, Any] = {}
+        for entry_id, task in tasks.items():
+            if task.cancelled() or entry_id not in self.members:
+                continue
+            if (err := task.exception()) is not None:
+                self._retry_at[entry_id] = now + min(
+                    self.members[entry_id].section_intervals.values()
+                )
+                results[entry_id] = err
+            else:
+                self._retry_at.pop(entry_id, None)
+                results[entry_id] = task.result()
+
+        self.last_duration = round(time.monotonic() - started, 1)
+        self.last_size = len(tasks)
+        self._schedule_next_batch(dt_util.utcnow())
+        return results
+
 
 class HavaDurumuDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Hava Durumu data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        alerts_coordinator: HavaDurumuAlertsCoordinator,
+        refresh_scheduler: RefreshScheduler,
+        batch: HavaDurumuBatchCoordinator | None = None,
+        neighbors: NeighborLookup | None = None,
+    ) -> None:
         """Initialize the coordinator."""
         self.entry = entry
         self.merkez_id = entry.data[CONF_MERKEZ_ID]
         self.province = entry.data.get("province", "")
         self.district = entry.data.get("district", "")
-        
-        session = async_get_clientsession(hass)
-        self.api = MGMApiClient(session)
+        self.alerts_coordinator = alerts_coordinator
+        self.refresh_scheduler = refresh_scheduler
+        # In batch mode the batch coordinator wakes this location up
+        self.batch = batch
+        # Fills fields the station does not measure from nearby stations
+        self.neighbors = neighbors
+        # Recent observations for the trend sensors
+        self.trends = TrendTracker()
+
+        # Slow current conditions requests are hedged at the chosen percentile
+        hedge_percentile = int(entry.options.get(CONF_HEDGE_PERCENTILE, 0))
+        self.api = create_api_client(
+            hass, self.merkez_id, hedge_percentile / 100 if hedge_percentile else None
+        )
 
-        # Get update interval from options, default to 30 minutes
-        update_interval = int(entry.options.get("update_interval", UPDATE_INTERVAL))
+        # Each endpoint has its own refresh cadence, default to 30 minutes
+        # for current conditions and longer for the forecasts
+        self.section_intervals: dict[str, timedelta] = {
+            "current": timedelta(
+                seconds=int(entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL))
+            ),
+            "hourly": timedelta(
+                seconds=int(entry.options.get(CONF_HOURLY_INTERVAL, HOURLY_UPDATE_INTERVAL))
+            ),
+            "daily": timedelta(
+                seconds=int(entry.options.get(CONF_DAILY_INTERVAL, DAILY_UPDATE_INTERVAL))
+            ),
+        }
+        self._next_section_update: dict[str, datetime] = {}
+        # Refresh slot of this location, shared by all sections so they are
+        # fetched in the same wake-up. Batched locations share the same
+        # slots so they are fetched by the same batch.
+        self._phase = (
+            timedelta(0)
+            if batch is not None
+            else refresh_scheduler.offset(self.merkez_id, min(self.section_intervals.values()))
+        )
+        # Current conditions follow the station's publication cadence
+        # unless the user asked for a fixed interval, spread like the slots
+        self.scheduler: AdaptiveScheduler | None = (
+            AdaptiveScheduler(
+                self.section_intervals["current"],
+                phase=0.0 if batch is not None else stagger_fraction(self.merkez_id),
+            )
+            if entry.options.get(CONF_ADAPTIVE_POLLING, True)
+            else None
+        )
+        # Incremented whenever the content of a data section changes, so
+        # entities can cache values derived from it
+        self.generations: dict[str, int] = {}
+        # Rain and snow index of the hourly forecast with its generation
+        self._precipitation: tuple[int, PrecipitationIndex] | None = None
+        # When each section was last fetched from MGM
+        self.updated_at: dict[str, datetime] = {}
+        self._store = snapshot_store(hass, entry.entry_id)
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=None if batch is not None else min(self.section_intervals.values()),
+            always_update=False,
         )
 
+    def _alert_data(self) -> dict[str, Any]:
+        """Return the alerts for this location from the shared alerts coordinator."""
+        alert_data = self.alerts_coordinator.data or {}
+        if (index := alert_data.get("index")) is None:
+            return {"alerts": [], "meteoalarm": []}
+        alerts, meteoalarm = index.lookup(self.merkez_id, self.province)
+        return {"alerts": alerts, "meteoalarm": meteoalarm}
+
+    def _bump_generations(self, new_data: dict[str, Any]) -> None:
+        """Advance the generation of every section whose content changed."""
+        old_data = self.data or {}
+        for section, value in new_data.items():
+            if section not in old_data or old_data[section] != value:
+                self.generations[section] = self.generations.get(section, 0) + 1
+
+    @callback
+    def async_handle_alerts_update(self) -> None:
+        """Fan out new alert data from the shared alerts coordinator."""
+        if self.data is None:
+            return
+        new_data = {**self.data, **self._alert_data()}
+        self._bump_generations(new_data)
+        self.data = new_data
+        self.async_update_listeners()
+
+    @callback
+    def async_handle_batch_update(self) -> None:
+        """Take over the result of this location from the last batch."""
+        if self.batch is None or (
+            result := (self.batch.data or {}).get(self.entry.entry_id)
+        ) is None:
+            return
+        if isinstance(result, Exception):
+            self.async_set_update_error(result)
+        elif result != self.data or not self.last_update_success:
+            self.async_set_updated_data(result)
+
+    async def async_load_snapshot(self) -> bool:
+        """Seed the coordinator with the dataset saved before the last shutdown."""
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return False
+
+        current = snapshot.get("current")
+        new_data = {
+            "current": CurrentConditions.from_dict(current) if current else None,
+            "hourly": [HourlyForecast.from_dict(hour) for hour in snapshot.get("hourly", [])],
+            "daily": [DailyForecast.from_dict(day) for day in snapshot.get("daily", [])],
+            **self._alert_data(),
+        }
+        if self.neighbors is not None:
+            new_data["neighbors"] = snapshot.get("neighbors", {})
+        self.trends.restore(snapshot.get("trends", {}))
+        new_data["trends"] = self.trends.values()
+        self._bump_generations(new_data)
+        self.data = new_data
+
+        # Sections that are still fresh are not fetched again after a restart
+        for section, next_update in snapshot.get("next_update", {}).items():
+            if section in self.section_intervals and (
+                parsed := dt_util.parse_datetime(next_update)
+            ):
+                self._next_section_update[section] = parsed
+        for section, updated_at in snapshot.get("updated_at", {}).items():
+            if parsed := dt_util.parse_datetime(updated_at):
+                self.updated_at[section] = parsed
+
+        if self.scheduler is not None:
+            self.scheduler.restore(snapshot.get("scheduler", {}))
+
+        _LOGGER.debug("Loaded saved MGM weather data for %s", self.location_name)
+        return True
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to persist for the next startup."""
+        data = self.data or {}
+        current: CurrentConditions | None = data.get("current")
+        return {
+            "current": current.as_dict() if current else None,
+            "hourly": [hour.as_dict() for hour in data.get("hourly", [])],
+            "daily": [day.as_dict() for day in data.get("daily", [])],
+            "next_update": {
+                section: next_update.isoformat()
+                for section, next_update in self._next_section_update.items()
+            },
+            "updated_at": {
+                section: updated_at.isoformat()
+                for section, updated_at in self.updated_at.items()
+            },
+            "scheduler": self.scheduler.as_dict() if self.scheduler else {},
+            "neighbors": data.get("neighbors", {}),
+            "trends": self.trends.as_dict(),
+        }
+
+    def _due_sections(self, now: datetime) -> list[str]:
+        """Return the sections whose refresh interval has elapsed."""
+        return [
+            section
+            for section in self.section_intervals
+            if section not in self._next_section_update
+            or now + DUE_TOLERANCE >= self._next_section_update[section]
+        ]
+
+    @staticmethod
+    def _is_active(data: dict[str, Any]) -> bool:
+        """Return True while alerts are issued or precipitation is observed."""
+        current: CurrentConditions | None = data.get("current")
+        return bool(
+            data.get("alerts")
+            or data.get("meteoalarm")
+            or (current and (current.precipitation_now or current.precipitation_1h))
+        )
+
+    def next_wakeup(self, now: datetime) -> datetime:
+        """Return when the next section becomes due."""
+        return min(
+            self._next_section_update.get(section, now + interval)
+            for section, interval in self.section_intervals.items()
+        )
+
+    def _schedule_next_update(self, now: datetime) -> None:
+        """Wake up again when the next section becomes due."""
+        if self.batch is not None:
+            return
+        self.update_interval = max(self.next_wakeup(now) - now, DUE_TOLERANCE)
+
+    @callback
+    def async_mark_all_due(self) -> None:
+        """Make every section due so the next refresh fetches all data."""
+        self._next_section_update.clear()
+
+    def is_due(self, now: datetime) -> bool:
+        """Return True if any section should be fetched."""
+        return bool(self._due_sections(now))
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from MGM API."""
+        return await self._async_fetch_due_sections()
+
+    async def async_fetch_for_batch(self) -> dict[str, Any]:
+        """Fetch the due sections for the batch coordinator.
+
+        Raises UpdateFailed like a refresh. The batch coordinator hands the
+        result back through async_handle_batch_update.
+        """
+        return await self._async_fetch_due_sections()
+
+    async def _async_fetch_due_sections(self) -> dict[str, Any]:
+        """Fetch the due sections and return the new dataset."""
+        now = dt_util.utcnow()
+        sections = self._due_sections(now)
         _LOGGER.debug(
-            "Fetching MGM weather data for %s (interval: %s)",
+            "Fetching MGM weather data for %s (sections: %s)",
             self.location_name,
-            self.update_interval,
+            ", ".join(sections),
         )
+        neighbor_sources: dict[str, dict[str, Any]] = {}
         try:
-            new_data = await self.api.get_all_data(self.merkez_id)
-            
-            # If we already have data and the new current data is None (304), 
-            # keep the old data for current weather to avoid "unknown" state
-            if self.data and new_data.get("current") is None:
-                _LOGGER.debug("API returned no update for current weather, keeping old data")
-                new_data["current"] = self.data.get("current")
-            
-            if new_data.get("current") is None:
-                _LOGGER.warning("No current weather data received for %s", self.location_name)
-            
-            return new_data
-            
+            async with self.refresh_scheduler.limit:
+                fetched = await self.api.get_location_data(self.merkez_id, sections)
+                if self.neighbors is not None and fetched.get("current"):
+                    fetched["current"], neighbor_sources = await self.neighbors.async_fill(
+                        self.merkez_id, fetched["current"]
+                    )
         except MGMApiError as err:
             raise UpdateFailed(f"Error fetching MGM data: {err}") from err
         except Exception as err:
             _LOGGER.exception("Unexpected error fetching MGM data")
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+        new_data: dict[str, Any] = {
+            "current": None,
+            "hourly": [],
+            "daily": [],
+            **(self.data or {}),
+            **fetched,
+        }
+        new_data.update(self._alert_data())
+
+        # Sections MGM could not deliver keep their last good data until
+        # fresh data arrives, the "stale" section tells when it was fetched
+        stale: dict[str, datetime | None] = dict(new_data.get("stale", {}))
+        for section, value in fetched.items():
+            if value and not self.api.is_stale(SECTION_ENDPOINTS[section]):
+                self.updated_at[section] = now
+                stale.pop(section, None)
+                continue
+            if not value and self.data and self.data.get(section):
+                _LOGGER.debug("No %s data received, keeping the last good data", section)
+                new_data[section] = self.data[section]
+            if new_data.get(section):
+                stale[section] = self.updated_at.get(section)
+        new_data["stale"] = stale
+
+        # Current conditions fields taken from nearby stations and their source
+        if self.neighbors is not None and fetched.get("current"):
+            new_data["neighbors"] = neighbor_sources
+
+        # Trends only follow the station's own observations
+        if (current := fetched.get("current")) and self.trends.observe(
+            current, skip=neighbor_sources
+        ):
+            new_data["trends"] = self.trends.values()
+
+        if new_data.get("current") is None:
+            _LOGGER.warning("No current weather data received for %s", self.location_name)
+
+        # Sections that came back empty are retried on the next wake-up
+        for section, value in fetched.items():
+            if value and section == "current" and self.scheduler is not None:
+                self.scheduler.observe(value, now)
+                self._next_section_update[section] = self.scheduler.next_poll(
+                    now, self._is_active(new_data)
+                )
+            elif value:
+                self._next_section_update[section] = self.refresh_scheduler.next_refresh(
+                    now, self.section_intervals[section], self._phase
+                )
+            else:
+                self._next_section_update.pop(section, None)
+
+        self._schedule_next_update(now)
+        self._bump_generations(new_data)
+        if fetched:
+            self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        return new_data
+
+    @property
+    def next_section_update(self) -> dict[str, datetime]:
+        """Return when each data section is fetched next."""
+        return dict(self._next_section_update)
+
+    @property
+    def precipitation(self) -> PrecipitationIndex:
+        """Return the rain and snow index, built once per hourly forecast."""
+        generation = self.generations.get("hourly", 0)
+        if self._precipitation is None or self._precipitation[0] != generation:
+            hourly = (self.data or {}).get("hourly", [])
+            self._precipitation = (generation, PrecipitationIndex(hourly))
+        return self._precipitation[1]
+
     @property
     def location_name(self) -> str:
         """Return the location name."""
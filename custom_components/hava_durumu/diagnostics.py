@@ -0,0 +1,70 @@
+"""Diagnostics support for Hava Durumu."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import HavaDurumuDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: HavaDurumuDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    alerts_coordinator = coordinator.alerts_coordinator
+    data = coordinator.data or {}
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "section_intervals": {
+                section: str(interval)
+                for section, interval in coordinator.section_intervals.items()
+            },
+            "next_section_update": {
+                section: next_update.isoformat()
+                for section, next_update in coordinator.next_section_update.items()
+            },
+            "generations": dict(coordinator.generations),
+            "updated_at": {
+                section: updated_at.isoformat()
+                for section, updated_at in coordinator.updated_at.items()
+            },
+            "stale_sections": sorted(data.get("stale", {})),
+            "neighbor_sources": data.get("neighbors", {}),
+            "data": {
+                "current": data["current"].as_dict() if data.get("current") else None,
+                "hourly_count": len(data.get("hourly", [])),
+                "daily_count": len(data.get("daily", [])),
+                "alert_count": len(data.get("alerts", [])),
+                "meteoalarm_count": len(data.get("meteoalarm", [])),
+            },
+        },
+        "batch_coordinator": {
+            "locations": len(coordinator.batch.members),
+            "last_size": coordinator.batch.last_size,
+            "last_duration": coordinator.batch.last_duration,
+            "update_interval": str(coordinator.batch.update_interval),
+        }
+        if coordinator.batch is not None
+        else None,
+        "alerts_coordinator": {
+            "last_update_success": alerts_coordinator.last_update_success,
+            "update_interval": str(alerts_coordinator.update_interval),
+        },
+        "api": {
+            "location": coordinator.api.metrics.as_dict(),
+            "alerts": alerts_coordinator.api.metrics.as_dict(),
+            "circuit_breaker": coordinator.api.breaker.as_dict(),
+        },
+    }
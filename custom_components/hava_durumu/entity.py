@@ -0,0 +1,49 @@
+"""Shared entity helpers for Hava Durumu."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+
+from .coordinator import HavaDurumuDataUpdateCoordinator
+
+
+class SectionUpdateMixin:
+    """Skip state writes when the data sections an entity reads did not change.
+
+    Entities list the coordinator data sections they depend on in
+    ``_data_sections``. A coordinator update only writes state when the
+    generation of one of those sections, or the availability, changed.
+    """
+
+    coordinator: HavaDurumuDataUpdateCoordinator
+    _data_sections: tuple[str, ...] = ()
+    _written_inputs: tuple[Any, ...] | None = None
+
+    def _current_inputs(self) -> tuple[Any, ...]:
+        """Return the availability and generations of the watched sections."""
+        generations = self.coordinator.generations
+        return (
+            self.coordinator.last_update_success,
+            *(generations.get(section, 0) for section in self._data_sections),
+        )
+
+    @callback
+    def _inputs_changed(self) -> bool:
+        """Return True and remember the inputs if they changed since the last write."""
+        inputs = self._current_inputs()
+        if inputs == self._written_inputs:
+            return False
+        self._written_inputs = inputs
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the inputs of the initial state write."""
+        await super().async_added_to_hass()  # type: ignore[misc]
+        self._written_inputs = self._current_inputs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._inputs_changed():
+            super()._handle_coordinator_update()  # type: ignore[misc]
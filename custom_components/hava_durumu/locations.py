@@ -0,0 +1,299 @@
+"""Offline index of MGM provinces and districts."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import MGMApiError
+from .const import (
+    DATA_LOCATIONS,
+    DOMAIN,
+    LOCATIONS_REFRESH_INTERVAL,
+    STORAGE_KEY_LOCATIONS,
+    STORAGE_VERSION,
+)
+from .coordinator import create_api_client
+from .spatial import StationIndex
+from .util import turkish_casefold, turkish_sort_key
+
+_LOGGER = logging.getLogger(__name__)
+
+# Location fields kept in the local copy
+LOCATION_FIELDS = ("il", "ilce", "merkezId", "enlem", "boylam")
+
+# Province district lists downloaded in parallel during a full refresh
+REFRESH_CONCURRENCY = 4
+
+
+def _project(location: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of a location kept in the index."""
+    return {field: location.get(field) for field in LOCATION_FIELDS}
+
+
+def location_name(location: dict[str, Any]) -> str:
+    """Return "district, province" of a location."""
+    if location.get("ilce"):
+        return f"{location['ilce']}, {location['il']}"
+    return location.get("il") or str(location.get("merkezId"))
+
+
+class LocationIndex:
+    """Provinces and districts with Turkish aware prefix search.
+
+    Search keys are Turkish case folded and kept in a sorted array, built on
+    the first search. A prefix query is a binary search followed by a scan
+    of the matching run.
+    """
+
+    __slots__ = ("_locations", "_districts", "_provinces", "_keys", "_stations")
+
+    def __init__(self, locations: Iterable[dict[str, Any]]) -> None:
+        """Build the index."""
+        self._locations: list[dict[str, Any]] = []
+        self._districts: dict[str, dict[str, dict[str, Any]]] = {}
+        self._provinces: dict[str, str] = {}
+        seen: set[Any] = set()
+
+        for location in locations:
+            province, district = location.get("il"), location.get("ilce")
+            merkez_id = location.get("merkezId")
+            if not province or not merkez_id or merkez_id in seen:
+                continue
+            seen.add(merkez_id)
+            self._locations.append(location)
+            province_key = turkish_casefold(province)
+            self._provinces.setdefault(province_key, province)
+            districts = self._districts.setdefault(province_key, {})
+            if district:
+                districts[turkish_casefold(district)] = location
+
+        self._keys: list[tuple[str, int]] | None = None
+        self._stations: StationIndex | None = None
+
+    def __len__(self) -> int:
+        """Return the number of locations."""
+        return len(self._locations)
+
+    @property
+    def locations(self) -> list[dict[str, Any]]:
+        """Return all locations."""
+        return self._locations
+
+    @property
+    def stations(self) -> StationIndex:
+        """Return the spatial index of the locations, built on first use."""
+        if self._stations is None:
+            self._stations = StationIndex(self._locations)
+        return self._stations
+
+    def provinces(self) -> list[str]:
+        """Return the province names in alphabetical order."""
+        return sorted(self._provinces.values(), key=turkish_sort_key)
+
+    def province(self, name: str) -> str | None:
+        """Return the canonical spelling of a province name."""
+        return self._provinces.get(turkish_casefold(name))
+
+    def districts(self, province: str) -> list[str]:
+        """Return the district names of a province in alphabetical order."""
+        districts = self._districts.get(turkish_casefold(province), {})
+        return sorted((location["ilce"] for location in districts.values()), key=turkish_sort_key)
+
+    def location(self, province: str, district: str) -> dict[str, Any] | None:
+        """Return a location by province and district name."""
+        return self._districts.get(turkish_casefold(province), {}).get(
+            turkish_casefold(district)
+        )
+
+    def _search_keys(self) -> list[tuple[str, int]]:
+        """Return the sorted (search key, position) pairs, built on first use.
+
+        Every location is found by its district name and by "province district".
+        """
+        if self._keys is None:
+            keys: list[tuple[str, int]] = []
+            for position, location in enumerate(self._locations):
+                if not location.get("ilce"):
+                    continue
+                district_key = turkish_casefold(location["ilce"])
+                keys.append((district_key, position))
+                keys.append((f"{turkish_casefold(location['il'])} {district_key}", position))
+            keys.sort()
+            self._keys = keys
+        return self._keys
+
+    def search(self, query: str, limit: int = 15) -> list[dict[str, Any]]:
+        """Return the locations whose district, or province and district, start with query."""
+        prefix = turkish_casefold(query)
+        if not prefix:
+            return []
+        keys = self._search_keys()
+        results: list[dict[str, Any]] = []
+        found: set[int] = set()
+        for key, position in keys[bisect_left(keys, (prefix,)):]:
+            if not key.startswith(prefix) or len(results) >= limit:
+                break
+            if position not in found:
+                found.add(position)
+                results.append(self._locations[position])
+        return results
+
+
+class LocationCache:
+    """Locally stored location index, refreshed from MGM in the background."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.index = LocationIndex(())
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY_LOCATIONS)
+        self._client = create_api_client(hass)
+        self._updated_at: datetime | None = None
+        self._loaded = False
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def _async_load(self) -> None:
+        """Load the stored copy once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if stored := await self._store.async_load():
+            self.index = LocationIndex(stored.get("locations", []))
+            self._updated_at = dt_util.parse_datetime(stored.get("updated_at") or "")
+
+    @callback
+    def _async_save(self) -> None:
+        """Store the current index."""
+        self._store.async_delay_save(
+            lambda: {
+                "updated_at": self._updated_at.isoformat() if self._updated_at else None,
+                "locations": self.index.locations,
+            }
+        )
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the index should be downloaded again."""
+        return self._updated_at is None or dt_util.utcnow() - self._updated_at > timedelta(
+            seconds=LOCATIONS_REFRESH_INTERVAL
+        )
+
+    async def async_get_index(self) -> LocationIndex:
+        """Return the index, downloading the province list if nothing is stored.
+
+        Raises MGMApiError if there is no local copy and MGM cannot be reached.
+        """
+        await self._async_load()
+        if not self.index.provinces():
+            provinces = await self._client.get_provinces()
+            self.index = LocationIndex(_project(location) for location in provinces)
+            self._async_save()
+        if self.is_stale:
+            self.async_schedule_refresh()
+        return self.index
+
+    async def async_get_full_index(self) -> LocationIndex:
+        """Return the index with every district, downloading them once if needed.
+
+        Raises MGMApiError if there is no local copy and MGM cannot be reached.
+        """
+        await self.async_get_index()
+        if self._updated_at is None and self._refresh_task is not None:
+            await asyncio.shield(self._refresh_task)
+        return self.index
+
+    async def async_get_districts(self, province: str) -> list[str]:
+        """Return the districts of a province, downloading them if not yet known."""
+        index = await self.async_get_index()
+        # Province lists only hold the center district until the province
+        # was refreshed
+        if len(districts := index.districts(province)) > 1:
+            return districts
+        try:
+            locations = await self._async_fetch_province(province)
+        except MGMApiError:
+            if districts:
+                return districts
+            raise
+        self._merge(locations)
+        self._async_save()
+        return self.index.districts(province)
+
+    async def async_refresh_if_stale(self) -> None:
+        """Schedule a background refresh if the stored copy is outdated."""
+        await self._async_load()
+        if len(self.index) and self.is_stale:
+            self.async_schedule_refresh()
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Download every province and district in the background."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_background_task(
+                self._async_refresh(), f"{DOMAIN}_locations_refresh"
+            )
+
+    async def _async_fetch_province(self, province: str) -> list[dict[str, Any]]:
+        """Download the districts of a province."""
+        key = turkish_casefold(province)
+        return [
+            _project(location)
+            for location in await self._client.search_locations(province, limit=100)
+            if turkish_casefold(location.get("il") or "") == key
+        ]
+
+    def _merge(self, locations: list[dict[str, Any]]) -> None:
+        """Add the downloaded districts of a province to the index."""
+        # Downloaded entries come first and win over stored ones with the same ID
+        self.index = LocationIndex([*locations, *self.index.locations])
+
+    async def _async_refresh(self) -> None:
+        """Download the full location list from MGM."""
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+        async def fetch(province: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._async_fetch_province(province)
+
+        try:
+            provinces = await self._client.get_provinces()
+        except MGMApiError as err:
+            _LOGGER.debug("Could not refresh the MGM location list: %s", err)
+            return
+
+        locations: list[dict[str, Any]] = []
+        names = sorted({location["il"] for location in provinces if location.get("il")})
+        results = await asyncio.gather(*(fetch(name) for name in names), return_exceptions=True)
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                # Keep the districts we already know for this province
+                _LOGGER.debug("Could not refresh the districts of %s: %s", name, result)
+                key = turkish_casefold(name)
+                result = [
+                    location
+                    for location in self.index.locations
+                    if turkish_casefold(location["il"]) == key
+                ]
+            locations.extend(result)
+        # Province centers are kept even if the district search missed them
+        locations.extend(_project(location) for location in provinces)
+
+        self.index = LocationIndex(locations)
+        self._updated_at = dt_util.utcnow()
+        self._async_save()
+        _LOGGER.debug("Refreshed MGM location list (%d locations)", len(self.index))
+
+
+def async_get_location_cache(hass: HomeAssistant) -> LocationCache:
+    """Return the location cache shared by the config flows."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_LOCATIONS not in domain_data:
+        domain_data[DATA_LOCATIONS] = LocationCache(hass)
+    return domain_data[DATA_LOCATIONS]
@@ -0,0 +1,189 @@
+"""Request metrics of the MGM API client."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Upper bounds of the latency histogram buckets in milliseconds, the last
+# bucket collects everything slower
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _ratio(part: int, total: int) -> float | None:
+    """Return part / total rounded for display, None without data."""
+    return round(part / total, 3) if total else None
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters of one MGM endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    not_modified: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    stale_served: int = 0
+    rejected: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    bytes_total: int = 0
+    bytes_last: int | None = None
+    latency_total_ms: float = 0.0
+    latency_last_ms: float | None = None
+    latency_max_ms: float = 0.0
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    statuses: dict[str, int] = field(default_factory=dict)
+    last_success: datetime | None = None
+    last_error: str | None = None
+
+    @property
+    def latency_mean_ms(self) -> float | None:
+        """Return the mean latency of requests that reached MGM."""
+        if not self.requests:
+            return None
+        return round(self.latency_total_ms / self.requests, 1)
+
+    def latency_percentile_ms(self, percentile: float) -> float | None:
+        """Estimate a latency percentile from the histogram.
+
+        The value is interpolated inside the bucket holding the percentile
+        and capped at the slowest request seen.
+        """
+        if not self.requests:
+            return None
+        rank = percentile * self.requests
+        seen = 0
+        for index, count in enumerate(self.latency_buckets):
+            if count and seen + count >= rank:
+                low = LATENCY_BUCKETS_MS[index - 1] if index else 0
+                high = (
+                    LATENCY_BUCKETS_MS[index]
+                    if index < len(LATENCY_BUCKETS_MS)
+                    else self.latency_max_ms
+                )
+                estimate = low + (high - low) * (rank - seen) / count
+                return round(min(estimate, self.latency_max_ms), 1)
+            seen += count
+        return round(self.latency_max_ms, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and derived ratios."""
+        served = self.requests + self.cache_hits + self.coalesced
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "not_modified_ratio": _ratio(self.not_modified, self.requests),
+            "cache_hit_ratio": _ratio(self.cache_hits + self.coalesced, served),
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "stale_served": self.stale_served,
+            "rejected": self.rejected,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "bytes_total": self.bytes_total,
+            "bytes_last": self.bytes_last,
+            "latency_mean_ms": self.latency_mean_ms,
+            "latency_p50_ms": self.latency_percentile_ms(0.5),
+            "latency_p95_ms": self.latency_percentile_ms(0.95),
+            "latency_last_ms": self.latency_last_ms,
+            "latency_max_ms": round(self.latency_max_ms, 1),
+            "histogram": {
+                f"le_{bound}": count
+                for bound, count in zip(
+                    (*LATENCY_BUCKETS_MS, "inf"), self.latency_buckets
+                )
+            },
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_error": self.last_error,
+        }
+
+
+class ApiMetrics:
+    """Per endpoint metrics of an API client."""
+
+    __slots__ = ("endpoints",)
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def get(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint."""
+        if (metrics := self.endpoints.get(endpoint)) is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def _record_latency(self, metrics: EndpointMetrics, latency: float) -> None:
+        """Add a request duration in seconds."""
+        latency_ms = latency * 1000
+        metrics.requests += 1
+        metrics.latency_total_ms += latency_ms
+        metrics.latency_last_ms = round(latency_ms, 1)
+        metrics.latency_max_ms = max(metrics.latency_max_ms, latency_ms)
+        metrics.latency_buckets[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+    def record_response(
+        self, endpoint: str, status: int, latency: float, size: int
+    ) -> None:
+        """Record a response received from MGM."""
+        metrics = self.get(endpoint)
+        self._record_latency(metrics, latency)
+        metrics.statuses[str(status)] = metrics.statuses.get(str(status), 0) + 1
+        metrics.bytes_total += size
+        metrics.bytes_last = size
+        if status in (200, 304):
+            metrics.last_success = dt_util.utcnow()
+            if status == 304:
+                metrics.not_modified += 1
+        else:
+            metrics.errors += 1
+            metrics.last_error = f"HTTP {status}"
+
+    def record_error(self, endpoint: str, latency: float, error: str) -> None:
+        """Record a request that failed without a response."""
+        metrics = self.get(endpoint)
+        self._record_latency(metrics, latency)
+        metrics.errors += 1
+        metrics.last_error = error
+
+    def record_cache_hit(self, endpoint: str) -> None:
+        """Record a request answered from memory."""
+        self.get(endpoint).cache_hits += 1
+
+    def record_coalesced(self, endpoint: str) -> None:
+        """Record a request that joined an identical request in flight."""
+        self.get(endpoint).coalesced += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        """Record a failed request that is sent again."""
+        self.get(endpoint).retries += 1
+
+    def record_stale(self, endpoint: str) -> None:
+        """Record a failed request answered with the last good response."""
+        self.get(endpoint).stale_served += 1
+
+    def record_rejected(self, endpoint: str) -> None:
+        """Record a request not sent because the circuit breaker is open."""
+        self.get(endpoint).rejected += 1
+
+    def record_hedged(self, endpoint: str) -> None:
+        """Record a slow request that was sent a second time."""
+        self.get(endpoint).hedged += 1
+
+    def record_hedge_win(self, endpoint: str) -> None:
+        """Record a hedged request answered before the original one."""
+        self.get(endpoint).hedge_wins += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics of every endpoint."""
+        return {endpoint: metrics.as_dict() for endpoint, metrics in self.endpoints.items()}
@@ -0,0 +1,151 @@
+"""Typed records for MGM weather data."""
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, TypeVar
+
+from .const import MISSING_VALUE
+
+_RecordT = TypeVar("_RecordT", bound="_Record")
+
+# Days of the daily forecast payload (Gun0 ... Gun5)
+DAILY_FORECAST_DAYS = 6
+
+
+def _value(raw: dict[str, Any], key: str) -> Any:
+    """Return a field of an MGM payload with the missing value sentinel as None."""
+    value = raw.get(key)
+    if value == MISSING_VALUE:
+        return None
+    return value
+
+
+class _Record:
+    """Serialization helpers shared by the MGM records."""
+
+    __slots__ = ()
+
+    # Record field -> key of the MGM payload it is read from
+    API_KEYS: ClassVar[dict[str, str]] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a JSON serializable dict."""
+        # Fields are flat values, a shallow copy is enough and much cheaper
+        # than dataclasses.asdict
+        return {field: getattr(self, field) for field in self.API_KEYS}
+
+    @classmethod
+    def from_dict(cls: type[_RecordT], data: dict[str, Any]) -> _RecordT:
+        """Create a record from a dict returned by as_dict."""
+        return cls(**{field.name: data.get(field.name) for field in fields(cls)})  # type: ignore[arg-type]
+
+
+@dataclass(slots=True)
+class CurrentConditions(_Record):
+    """Latest observation of a station (/sondurumlar)."""
+
+    temperature: float | None = None
+    apparent_temperature: float | None = None
+    humidity: float | None = None
+    wind_speed: float | None = None
+    wind_bearing: float | None = None
+    pressure: float | None = None
+    actual_pressure: float | None = None
+    visibility: float | None = None
+    cloud_coverage: int | None = None
+    precipitation_now: float | None = None
+    precipitation_10m: float | None = None
+    precipitation_1h: float | None = None
+    precipitation_6h: float | None = None
+    precipitation_12h: float | None = None
+    precipitation_24h: float | None = None
+    condition_code: str | None = None
+    observed_at: str | None = None
+
+    API_KEYS: ClassVar[dict[str, str]] = {
+        "temperature": "sicaklik",
+        "apparent_temperature": "hissedilenSicaklik",
+        "humidity": "nem",
+        "wind_speed": "ruzgarHiz",
+        "wind_bearing": "ruzgarYon",
+        "pressure": "denizeIndirgenmisBasinc",
+        "actual_pressure": "aktuelBasinc",
+        "visibility": "gorus",
+        "cloud_coverage": "kapalilik",
+        "precipitation_now": "yagis00Now",
+        "precipitation_10m": "yagis10Dk",
+        "precipitation_1h": "yagis1Saat",
+        "precipitation_6h": "yagis6Saat",
+        "precipitation_12h": "yagis12Saat",
+        "precipitation_24h": "yagis24Saat",
+        "condition_code": "hadiseKodu",
+        "observed_at": "veriZamani",
+    }
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> CurrentConditions:
+        """Create the record from an MGM current conditions payload."""
+        return cls(**{field: _value(raw, key) for field, key in cls.API_KEYS.items()})
+
+
+@dataclass(slots=True)
+class HourlyForecast(_Record):
+    """One slot of the hourly forecast (/tahminler/saatlik)."""
+
+    datetime: str | None = None
+    condition_code: str | None = None
+    temperature: float | None = None
+    humidity: float | None = None
+    wind_speed: float | None = None
+    wind_bearing: float | None = None
+
+    API_KEYS: ClassVar[dict[str, str]] = {
+        "datetime": "tarih",
+        "condition_code": "hadise",
+        "temperature": "sicaklik",
+        "humidity": "nem",
+        "wind_speed": "ruzgarHizi",
+        "wind_bearing": "ruzgarYonu",
+    }
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> HourlyForecast:
+        """Create the record from an MGM hourly forecast entry."""
+        return cls(**{field: _value(raw, key) for field, key in cls.API_KEYS.items()})
+
+
+@dataclass(slots=True)
+class DailyForecast(_Record):
+    """One day of the daily forecast (/tahminler/gunluk)."""
+
+    date: str | None = None
+    condition_code: str | None = None
+    temperature_low: float | None = None
+    temperature_high: float | None = None
+    wind_speed: float | None = None
+    wind_bearing: float | None = None
+    humidity_low: float | None = None
+    humidity_high: float | None = None
+
+    # Keys without the day suffix
+    API_KEYS: ClassVar[dict[str, str]] = {
+        "date": "tarih",
+        "condition_code": "hadise",
+        "temperature_low": "enDusuk",
+        "temperature_high": "enYuksek",
+        "wind_speed": "ruzgarHiz",
+        "wind_bearing": "ruzgarYon",
+        "humidity_low": "enDusukNem",
+        "humidity_high": "enYuksekNem",
+    }
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any], day: int) -> DailyForecast:
+        """Create the record for one day of an MGM daily forecast payload.
+
+        The API returns all days in a single object with the day index as
+        key suffix (enDusukGun0, enYuksekGun0, ...).
+        """
+        return cls(
+            **{field: _value(raw, f"{key}Gun{day}") for field, key in cls.API_KEYS.items()}
+        )
@@ -0,0 +1,105 @@
+"""Fill fields a station does not measure from nearby stations."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .coordinator import create_api_client
+from .locations import async_get_location_cache, location_name
+from .models import CurrentConditions
+
+_LOGGER = logging.getLogger(__name__)
+
+# Current conditions fields many stations report as -9999
+NEIGHBOR_FIELDS = ("visibility", "humidity", "pressure", "cloud_coverage")
+
+# Nearest stations asked for a missing field and the farthest one that
+# still counts as nearby
+NEIGHBOR_COUNT = 4
+NEIGHBOR_MAX_DISTANCE_KM = 50.0
+
+# Seconds the current conditions of a nearby station are reused
+NEIGHBOR_CACHE_TTL = 900
+
+
+class NeighborLookup:
+    """Current conditions of nearby stations, shared by all config entries.
+
+    Nearby stations come from the spatial index of the local location
+    list, which is built once per list. Current conditions of nearby
+    stations are fetched together and reused for NEIGHBOR_CACHE_TTL, so
+    locations with the same neighbors share the requests.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the lookup."""
+        self.hass = hass
+        self._client = create_api_client(hass)
+        self._cache: dict[int, tuple[float, CurrentConditions | None]] = {}
+
+    async def _async_get_current(self, merkez_id: int) -> CurrentConditions | None:
+        """Return the current conditions of a station, from memory if recent."""
+        cached = self._cache.get(merkez_id)
+        if cached is not None and time.monotonic() - cached[0] < NEIGHBOR_CACHE_TTL:
+            return cached[1]
+        current = await self._client.get_current_weather(merkez_id)
+        self._cache[merkez_id] = (time.monotonic(), current)
+        return current
+
+    async def async_fill(
+        self, merkez_id: Any, current: CurrentConditions
+    ) -> tuple[CurrentConditions, dict[str, dict[str, Any]]]:
+        """Fill missing fields from the nearest stations reporting them.
+
+        Returns the completed conditions and the source station of every
+        filled field. Nearby values are optional, so any failure returns
+        the conditions unchanged instead of failing the update.
+        """
+        missing = [field for field in NEIGHBOR_FIELDS if getattr(current, field) is None]
+        if not missing:
+            return current, {}
+        try:
+            return await self._async_fill(merkez_id, current, missing)
+        except Exception as err:
+            _LOGGER.debug("Could not fill %s from nearby stations: %s", merkez_id, err)
+            return current, {}
+
+    async def _async_fill(
+        self, merkez_id: Any, current: CurrentConditions, missing: list[str]
+    ) -> tuple[CurrentConditions, dict[str, dict[str, Any]]]:
+        """Fill the missing fields, raising on failures."""
+        index = await async_get_location_cache(self.hass).async_get_index()
+        neighbors = index.stations.nearest(merkez_id, NEIGHBOR_COUNT, NEIGHBOR_MAX_DISTANCE_KM)
+        if not neighbors:
+            return current, {}
+
+        results = await asyncio.gather(
+            *(self._async_get_current(int(location["merkezId"])) for location, _ in neighbors),
+            return_exceptions=True,
+        )
+        values: dict[str, Any] = {}
+        sources: dict[str, dict[str, Any]] = {}
+        for field in missing:
+            for (location, distance_km), result in zip(neighbors, results):
+                if isinstance(result, BaseException):
+                    _LOGGER.debug(
+                        "Could not fetch nearby station %s: %s", location["merkezId"], result
+                    )
+                    continue
+                if result is None or (value := getattr(result, field)) is None:
+                    continue
+                values[field] = value
+                sources[field] = {
+                    "merkez_id": location["merkezId"],
+                    "name": location_name(location),
+                    "distance_km": round(distance_km, 1),
+                }
+                break
+        if not values:
+            return current, {}
+        return replace(current, **values), sources
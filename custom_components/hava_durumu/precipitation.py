@@ -0,0 +1,146 @@
+"""Index of rain and snow in the hourly forecast."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+from homeassistant.components.weather import (
+    ATTR_CONDITION_LIGHTNING_RAINY,
+    ATTR_CONDITION_POURING,
+    ATTR_CONDITION_RAINY,
+    ATTR_CONDITION_SNOWY,
+    ATTR_CONDITION_SNOWY_RAINY,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import CONDITION_MAP
+from .models import HourlyForecast
+
+# MGM condition codes of every category, taken from the weather condition
+# they map to
+RAIN_CODES = frozenset(
+    code
+    for code, condition in CONDITION_MAP.items()
+    if condition
+    in (ATTR_CONDITION_RAINY, ATTR_CONDITION_POURING, ATTR_CONDITION_LIGHTNING_RAINY)
+)
+SNOW_CODES = frozenset(
+    code
+    for code, condition in CONDITION_MAP.items()
+    if condition in (ATTR_CONDITION_SNOWY, ATTR_CONDITION_SNOWY_RAINY)
+)
+CATEGORY_CODES = {
+    "rain": RAIN_CODES,
+    "snow": SNOW_CODES,
+    "precipitation": RAIN_CODES | SNOW_CODES,
+}
+
+# Length of a forecast slot when it cannot be told from the next one
+DEFAULT_SLOT_SECONDS = 3600.0
+
+
+class _Runs:
+    """Sorted, merged periods of one category with their running total."""
+
+    __slots__ = ("starts", "ends", "covered")
+
+    def __init__(self, periods: Iterable[tuple[float, float]]) -> None:
+        """Merge adjacent periods, which must come in order."""
+        self.starts = array("d")
+        self.ends = array("d")
+        for start, end in periods:
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+        # covered[i] is the total length of the runs before run i
+        self.covered = array("d", [0.0])
+        for start, end in zip(self.starts, self.ends):
+            self.covered.append(self.covered[-1] + end - start)
+
+    def first_ending_after(self, timestamp: float) -> int:
+        """Return the position of the first run not over at a time."""
+        return bisect_right(self.ends, timestamp)
+
+    def covered_before(self, timestamp: float) -> float:
+        """Return the length of the runs before a time."""
+        position = bisect_left(self.starts, timestamp)
+        if not position:
+            return 0.0
+        return self.covered[position] - max(self.ends[position - 1] - timestamp, 0.0)
+
+
+class PrecipitationIndex:
+    """Rain and snow periods of an hourly forecast for binary search queries.
+
+    The forecast is indexed once when it changes, every query is then a
+    binary search over the merged periods of a category.
+    """
+
+    __slots__ = ("horizon", "_runs")
+
+    def __init__(self, hourly: Iterable[HourlyForecast]) -> None:
+        """Index the slots of an hourly forecast."""
+        slots: list[tuple[float, str | None]] = []
+        for hour in hourly:
+            if hour.datetime and (start := dt_util.parse_datetime(hour.datetime)):
+                slots.append((start.timestamp(), hour.condition_code))
+        slots.sort(key=lambda slot: slot[0])
+
+        # A slot lasts until the next one, the last one as long as the one before
+        periods: list[tuple[float, float, str | None]] = []
+        for position, (start, code) in enumerate(slots):
+            if position + 1 < len(slots):
+                end = slots[position + 1][0]
+            elif periods:
+                end = start + (periods[-1][1] - periods[-1][0])
+            else:
+                end = start + DEFAULT_SLOT_SECONDS
+            periods.append((start, end, code))
+
+        self.horizon: float | None = periods[-1][1] if periods else None
+        self._runs = {
+            category: _Runs((start, end) for start, end, code in periods if code in codes)
+            for category, codes in CATEGORY_CODES.items()
+        }
+
+    def covers(self, timestamp: float) -> bool:
+        """Return True if the forecast reaches past a time."""
+        return self.horizon is not None and timestamp < self.horizon
+
+    def next_start(self, category: str, timestamp: float) -> float | None:
+        """Return the start of the current or next period of a category."""
+        runs = self._runs[category]
+        position = runs.first_ending_after(timestamp)
+        if position == len(runs.starts):
+            return None
+        return runs.starts[position]
+
+    def hours(self, category: str, timestamp: float, hours: float) -> float:
+        """Return the hours of a category in the given hours after a time."""
+        runs = self._runs[category]
+        covered = runs.covered_before(timestamp + hours * 3600) - runs.covered_before(timestamp)
+        return covered / 3600
+
+    def dry_window(self, timestamp: float) -> tuple[float | None, float | None] | None:
+        """Return the start and end of the current or next period without precipitation.
+
+        While already dry the start is the end of the last precipitation, or
+        None if there was none in the forecast. The end is None if the
+        forecast stays dry, the window is None if the forecast stays wet.
+        """
+        if not self.covers(timestamp):
+            return None
+        runs = self._runs["precipitation"]
+        position = runs.first_ending_after(timestamp)
+        start: float | None
+        if position < len(runs.starts) and runs.starts[position] <= timestamp:
+            start = runs.ends[position]
+            position += 1
+            if not self.covers(start):
+                return None
+        else:
+            start = runs.ends[position - 1] if position else None
+        return start, runs.starts[position] if position < len(runs.starts) else None
@@ -0,0 +1,190 @@
+"""Refresh scheduling of Hava Durumu locations."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
+from statistics import median
+from typing import Any
+import zlib
+
+from homeassistant.util import dt as dt_util
+
+from .const import ADAPTIVE_MAX_INTERVAL, ADAPTIVE_MIN_INTERVAL, MAX_CONCURRENT_REFRESHES
+from .models import CurrentConditions
+
+# Observation times kept to learn the publication cadence of a station
+HISTORY_SIZE = 8
+
+# Bounds of a plausible publication cadence
+MIN_CADENCE = timedelta(minutes=5)
+MAX_CADENCE = timedelta(hours=3)
+
+# Extra wait after the expected publication time
+PUBLISH_MARGIN = timedelta(seconds=60)
+
+# Calm observations in a row before polls skip a publication, and the most
+# publications that are skipped
+CALM_STREAK = 3
+MAX_SKIPPED_PUBLICATIONS = 2
+
+# Temperature change in °C between observations still considered calm
+CALM_TEMPERATURE_DELTA = 1.0
+
+# Polls aligned to a publication are spread over this share of the
+# station's cadence, so the many stations publishing on the same MGM
+# cadence are not fetched together
+PUBLISH_SPREAD = 0.5
+
+# Origin of the refresh slots of fixed interval sections
+SLOT_EPOCH = datetime(2000, 1, 1, tzinfo=dt_util.UTC)
+
+
+def stagger_fraction(merkez_id: Any) -> float:
+    """Return a stable position in [0, 1) of a location among all locations."""
+    return zlib.crc32(str(merkez_id).encode()) / 2**32
+
+
+def next_slot(earliest: datetime, interval: timedelta, offset: timedelta) -> datetime:
+    """Return the first time at or after earliest on the grid offset + k * interval."""
+    slots = -((earliest - SLOT_EPOCH - offset) // -interval)
+    return SLOT_EPOCH + offset + slots * interval
+
+
+class RefreshScheduler:
+    """Pace the refreshes of every location.
+
+    Each location gets a fixed phase within the refresh interval derived
+    from its merkez_id, so locations set up together do not refresh
+    together, and at most max_concurrent locations fetch at the same time.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REFRESHES) -> None:
+        """Initialize the scheduler."""
+        self.limit = asyncio.Semaphore(max_concurrent)
+
+    @staticmethod
+    def offset(merkez_id: Any, interval: timedelta) -> timedelta:
+        """Return the phase of a location within an interval."""
+        return interval * stagger_fraction(merkez_id)
+
+    @staticmethod
+    def next_refresh(now: datetime, interval: timedelta, offset: timedelta) -> datetime:
+        """Return the refresh slot of a location closest to one interval from now."""
+        return next_slot(now + interval / 2, interval, offset)
+
+
+def _is_calm(previous: CurrentConditions, current: CurrentConditions) -> bool:
+    """Return True if nothing worth a faster refresh happened between observations."""
+    if current.precipitation_now or current.precipitation_1h:
+        return False
+    if previous.condition_code != current.condition_code:
+        return False
+    if previous.temperature is not None and current.temperature is not None:
+        return abs(current.temperature - previous.temperature) < CALM_TEMPERATURE_DELTA
+    return True
+
+
+class AdaptiveScheduler:
+    """Pick the next refresh of a station's current conditions.
+
+    The station's publication cadence is learned from the observation times
+    (veriZamani) and polls are placed just after the next observation is
+    expected to be published. Calm weather stretches polls over several
+    publications, active weather (alerts or precipitation) never waits
+    longer than the configured interval. A poll that finds no new
+    observation is retried with a growing delay. The phase of a location,
+    in [0, 1), places its polls within PUBLISH_SPREAD of the cadence after
+    the publication, and within the interval before a cadence is known.
+    """
+
+    def __init__(
+        self,
+        interval: timedelta,
+        min_interval: timedelta = timedelta(seconds=ADAPTIVE_MIN_INTERVAL),
+        max_interval: timedelta = timedelta(seconds=ADAPTIVE_MAX_INTERVAL),
+        phase: float = 0.0,
+    ) -> None:
+        """Initialize the scheduler with the configured refresh interval."""
+        self.interval = interval
+        self.phase = phase
+        self.min_interval = min(min_interval, interval)
+        self.max_interval = max(max_interval, interval)
+        self._observations: deque[datetime] = deque(maxlen=HISTORY_SIZE)
+        # Seconds between an observation time and the first poll that returned it
+        self._lags: deque[float] = deque(maxlen=HISTORY_SIZE)
+        self._last: CurrentConditions | None = None
+        self._calm_streak = 0
+        self._misses = 0
+
+    @property
+    def cadence(self) -> timedelta | None:
+        """Return the learned publication cadence of the station."""
+        observations = self._observations
+        gaps = [
+            later - earlier
+            for earlier, later in zip(observations, list(observations)[1:])
+            if later > earlier
+        ]
+        if not gaps:
+            return None
+        return min(max(median(gaps), MIN_CADENCE), MAX_CADENCE)
+
+    def observe(self, current: CurrentConditions, now: datetime) -> None:
+        """Learn from fetched current conditions."""
+        if current.observed_at is None or (
+            observed_at := dt_util.parse_datetime(current.observed_at)
+        ) is None:
+            return
+        if self._observations and observed_at <= self._observations[-1]:
+            # Polled before the next observation was published
+            self._misses += 1
+            return
+
+        self._misses = 0
+        self._lags.append(max((now - observed_at).total_seconds(), 0.0))
+        if self._last is not None:
+            self._calm_streak = self._calm_streak + 1 if _is_calm(self._last, current) else 0
+        self._last = current
+        self._observations.append(observed_at)
+
+    def next_poll(self, now: datetime, active: bool) -> datetime:
+        """Return when current conditions should be fetched next."""
+        upper = self.interval if active else self.max_interval
+        cadence = self.cadence
+        if cadence is None:
+            return next_slot(now + self.interval / 2, self.interval, self.interval * self.phase)
+
+        if self._misses:
+            # The observation is late, look again soon and a little later each time
+            retry = self.min_interval if active else max(self.min_interval, cadence / 6)
+            delay = min(retry * 2 ** (self._misses - 1), cadence)
+        else:
+            skipped = 0 if active else min(self._calm_streak // CALM_STREAK, MAX_SKIPPED_PUBLICATIONS)
+            spread = cadence * PUBLISH_SPREAD * self.phase
+            lag = timedelta(seconds=min(self._lags)) + PUBLISH_MARGIN + spread
+            expected = self._observations[-1] + cadence * (1 + skipped) + lag
+            if expected <= now:
+                # Catch up with publications that happened while we waited
+                expected += cadence * ((now - expected) // cadence + 1)
+            delay = expected - now
+
+        return now + min(max(delay, self.min_interval), upper)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned state for the snapshot."""
+        return {
+            "observations": [observed_at.isoformat() for observed_at in self._observations],
+            "lags": list(self._lags),
+            "calm_streak": self._calm_streak,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the state saved with as_dict."""
+        self._observations.extend(
+            parsed
+            for observed_at in data.get("observations", [])
+            if (parsed := dt_util.parse_datetime(observed_at)) is not None
+        )
+        self._lags.extend(data.get("lags", []))
+        self._calm_streak = data.get("calm_streak", 0)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
 from typing import Any, Callable
 
@@ -14,20 +15,37 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
     UnitOfLength,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import ATTRIBUTION, CONDITION_DESCRIPTIONS, DOMAIN
+from .const import (
+    ATTRIBUTION,
+    CONDITION_DESCRIPTIONS,
+    DOMAIN,
+    ENDPOINT_CURRENT,
+    ENDPOINT_DAILY,
+    ENDPOINT_HOURLY,
+)
 from .coordinator import HavaDurumuDataUpdateCoordinator
+from .entity import SectionUpdateMixin
+from .models import CurrentConditions
+from .precipitation import PrecipitationIndex
 
 _LOGGER = logging.getLogger(__name__)
 
+# Only the API diagnostic sensors poll, they read the client metrics
+SCAN_INTERVAL = timedelta(minutes=1)
+
 
 def get_wind_direction_text(degrees: float | None) -> str | None:
     """Convert wind bearing degrees to Turkish cardinal direction.
@@ -58,7 +76,44 @@ def get_wind_direction_text(degrees: float | None) -> str | None:
 class HavaDurumuSensorEntityDescription(SensorEntityDescription):
     """Describes Hava Durumu sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], Any] | None = None
+    value_fn: Callable[[CurrentConditions], Any] | None = None
+    # Coordinator data sections the sensor state is derived from
+    sections: tuple[str, ...] = ("current",)
+    # Current conditions field that may be taken from a nearby station
+    neighbor_field: str | None = None
+    # Answer from the rain and snow index of the hourly forecast at a time
+    forecast_fn: Callable[[PrecipitationIndex, float], Any] | None = None
+
+
+# Index answers move with the clock, so they are refreshed with the current
+# conditions as well as with the hourly forecast
+FORECAST_SECTIONS = ("hourly", "current")
+
+
+def _timestamp(value: float | None) -> datetime | None:
+    """Return a timestamp of the index as a datetime."""
+    return dt_util.utc_from_timestamp(value) if value is not None else None
+
+
+def _will_fall(index: PrecipitationIndex, now: float, category: str) -> str:
+    """Return whether a category is forecast in the next 24 hours."""
+    if not index.covers(now):
+        return "Bilinmiyor"
+    return "Yağacak" if index.hours(category, now, 24) else "Yağmayacak"
+
+
+def _rain_hours(index: PrecipitationIndex, now: float) -> float | None:
+    """Return the forecast hours of rain in the next 24 hours."""
+    if not index.covers(now):
+        return None
+    return round(index.hours("rain", now, 24), 1)
+
+
+def _dry_window(index: PrecipitationIndex, now: float, end: bool) -> datetime | None:
+    """Return the start or end of the current or next period without precipitation."""
+    if (window := index.dry_window(now)) is None:
+        return None
+    return _timestamp(window[1] if end else window[0])
 
 
 SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
@@ -68,7 +123,7 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("sicaklik"),
+        value_fn=lambda current: current.temperature,
     ),
     HavaDurumuSensorEntityDescription(
         key="humidity",
@@ -76,7 +131,9 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("nem") if data.get("nem") is not None and data.get("nem") != -9999 else None,
+        value_fn=lambda current: current.humidity,
+        sections=("current", "neighbors"),
+        neighbor_field="humidity",
     ),
     HavaDurumuSensorEntityDescription(
         key="wind_speed",
@@ -84,13 +141,13 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
         device_class=SensorDeviceClass.WIND_SPEED,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("ruzgarHiz") if data.get("ruzgarHiz") is not None and data.get("ruzgarHiz") != -9999 else None,
+        value_fn=lambda current: current.wind_speed,
     ),
     HavaDurumuSensorEntityDescription(
         key="wind_bearing",
         translation_key="wind_bearing",
         icon="mdi:compass",
-        value_fn=lambda data: get_wind_direction_text(data.get("ruzgarYon")),
+        value_fn=lambda current: get_wind_direction_text(current.wind_bearing),
     ),
     HavaDurumuSensorEntityDescription(
         key="pressure",
@@ -98,7 +155,9 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPressure.HPA,
         device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("denizeIndirgenmisBasinc") if data.get("denizeIndirgenmisBasinc") is not None and data.get("denizeIndirgenmisBasinc") != -9999 else None,
+        value_fn=lambda current: current.pressure,
+        sections=("current", "neighbors"),
+        neighbor_field="pressure",
     ),
     HavaDurumuSensorEntityDescription(
         key="visibility",
@@ -106,7 +165,9 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.METERS,
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("gorus") if data.get("gorus") is not None and data.get("gorus") != -9999 and data.get("gorus") > 0 else None,
+        value_fn=lambda current: current.visibility if current.visibility and current.visibility > 0 else None,
+        sections=("current", "neighbors"),
+        neighbor_field="visibility",
     ),
     HavaDurumuSensorEntityDescription(
         key="precipitation_current",
@@ -115,7 +176,7 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-rainy",
-        value_fn=lambda data: data.get("yagis00Now") if data.get("yagis00Now") and data.get("yagis00Now") != -9999 else None,
+        value_fn=lambda current: current.precipitation_now or None,
     ),
     HavaDurumuSensorEntityDescription(
         key="precipitation_1h",
@@ -124,7 +185,7 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-rainy",
-        value_fn=lambda data: data.get("yagis1Saat") if data.get("yagis1Saat") and data.get("yagis1Saat") != -9999 else None,
+        value_fn=lambda current: current.precipitation_1h or None,
     ),
     HavaDurumuSensorEntityDescription(
         key="precipitation_24h",
@@ -133,7 +194,7 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:weather-rainy",
-        value_fn=lambda data: data.get("yagis24Saat") if data.get("yagis24Saat") and data.get("yagis24Saat") != -9999 else None,
+        value_fn=lambda current: current.precipitation_24h or None,
     ),
     HavaDurumuSensorEntityDescription(
         key="cloud_coverage",
@@ -141,7 +202,9 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         native_unit_of_measurement="okta",
         icon="mdi:cloud",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("kapalilik") if data.get("kapalilik") is not None and data.get("kapalilik") != -9999 else None,
+        value_fn=lambda current: current.cloud_coverage,
+        sections=("current", "neighbors"),
+        neighbor_field="cloud_coverage",
     ),
     HavaDurumuSensorEntityDescription(
         key="apparent_temperature",
@@ -149,14 +212,14 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("hissedilenSicaklik") if data.get("hissedilenSicaklik") is not None and data.get("hissedilenSicaklik") != -9999 else None,
+        value_fn=lambda current: current.apparent_temperature,
     ),
     HavaDurumuSensorEntityDescription(
         key="condition_text",
         translation_key="condition_text",
         icon="mdi:weather-partly-cloudy",
-        value_fn=lambda data: CONDITION_DESCRIPTIONS.get(
-            data.get("hadiseKodu", ""), data.get("hadiseKodu", "")
+        value_fn=lambda current: CONDITION_DESCRIPTIONS.get(
+            current.condition_code, current.condition_code
         ),
     ),
     HavaDurumuSensorEntityDescription(
@@ -164,36 +227,230 @@ SENSOR_DESCRIPTIONS: tuple[HavaDurumuSensorEntityDescription, ...] = (
         translation_key="alert_details",
         icon="mdi:alert-circle",
         value_fn=None,  # Will be handled separately
+        sections=("alerts", "meteoalarm"),
     ),
     HavaDurumuSensorEntityDescription(
         key="notification_status",
         translation_key="notification_status",
         icon="mdi:bell",
         value_fn=None,  # Will be handled separately
+        sections=(),
     ),
     HavaDurumuSensorEntityDescription(
         key="rain_forecast_24h",
         translation_key="rain_forecast_24h",
         icon="mdi:weather-rainy",
-        value_fn=None,  # Will be handled separately
+        forecast_fn=lambda index, now: _will_fall(index, now, "rain"),
+        sections=FORECAST_SECTIONS,
     ),
     HavaDurumuSensorEntityDescription(
         key="snow_forecast_24h",
         translation_key="snow_forecast_24h",
         icon="mdi:weather-snowy",
-        value_fn=None,  # Will be handled separately
+        forecast_fn=lambda index, now: _will_fall(index, now, "snow"),
+        sections=FORECAST_SECTIONS,
+    ),
+    HavaDurumuSensorEntityDescription(
+        key="next_rain",
+        translation_key="next_rain",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:weather-rainy",
+        forecast_fn=lambda index, now: _timestamp(index.next_start("rain", now)),
+        sections=FORECAST_SECTIONS,
+    ),
+    HavaDurumuSensorEntityDescription(
+        key="next_snow",
+        translation_key="next_snow",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:weather-snowy",
+        forecast_fn=lambda index, now: _timestamp(index.next_start("snow", now)),
+        sections=FORECAST_SECTIONS,
+    ),
+    HavaDurumuSensorEntityDescription(
+        key="rain_hours_24h",
+        translation_key="rain_hours_24h",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:weather-pouring",
+        forecast_fn=_rain_hours,
+        sections=FORECAST_SECTIONS,
+    ),
+    HavaDurumuSensorEntityDescription(
+        key="dry_window_start",
+        translation_key="dry_window_start",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:umbrella-closed-outline",
+        forecast_fn=lambda index, now: _dry_window(index, now, end=False),
+        sections=FORECAST_SECTIONS,
+    ),
+    HavaDurumuSensorEntityDescription(
+        key="dry_window_end",
+        translation_key="dry_window_end",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:umbrella-outline",
+        forecast_fn=lambda index, now: _dry_window(index, now, end=True),
+        sections=FORECAST_SECTIONS,
     ),
     HavaDurumuSensorEntityDescription(
         key="forecast_today",
         translation_key="forecast_today",
         icon="mdi:calendar-today",
         value_fn=None,  # Will be handled separately
+        sections=("daily",),
     ),
     HavaDurumuSensorEntityDescription(
         key="forecast_tomorrow",
         translation_key="forecast_tomorrow",
         icon="mdi:calendar-tomorrow",
         value_fn=None,  # Will be handled separately
+        sections=("daily",),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class HavaDurumuTrendSensorEntityDescription(SensorEntityDescription):
+    """Describes a Hava Durumu trend sensor, keyed like the trends section."""
+
+
+# Changes of the station's own observations over the last hours, kept by
+# the coordinator in memory so no recorder history is needed
+TREND_SENSOR_DESCRIPTIONS: tuple[HavaDurumuTrendSensorEntityDescription, ...] = (
+    HavaDurumuTrendSensorEntityDescription(
+        key="pressure_change_1h",
+        translation_key="pressure_change_1h",
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:gauge",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="pressure_change_3h",
+        translation_key="pressure_change_3h",
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:gauge",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="pressure_change_6h",
+        translation_key="pressure_change_6h",
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:gauge",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="pressure_rate",
+        translation_key="pressure_rate",
+        native_unit_of_measurement=f"{UnitOfPressure.HPA}/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:gauge",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="temperature_change_1h",
+        translation_key="temperature_change_1h",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:thermometer-lines",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="temperature_change_3h",
+        translation_key="temperature_change_3h",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer-lines",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="temperature_change_6h",
+        translation_key="temperature_change_6h",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:thermometer-lines",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="temperature_rate",
+        translation_key="temperature_rate",
+        native_unit_of_measurement=f"{UnitOfTemperature.CELSIUS}/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:thermometer-lines",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="humidity_change_1h",
+        translation_key="humidity_change_1h",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:water-percent",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="humidity_change_3h",
+        translation_key="humidity_change_3h",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-percent",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="humidity_change_6h",
+        translation_key="humidity_change_6h",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:water-percent",
+    ),
+    HavaDurumuTrendSensorEntityDescription(
+        key="humidity_rate",
+        translation_key="humidity_rate",
+        native_unit_of_measurement=f"{PERCENTAGE}/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        icon="mdi:water-percent",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class HavaDurumuApiSensorEntityDescription(SensorEntityDescription):
+    """Describes a Hava Durumu API diagnostic sensor."""
+
+    endpoint: str = ""
+
+
+API_SENSOR_DESCRIPTIONS: tuple[HavaDurumuApiSensorEntityDescription, ...] = (
+    HavaDurumuApiSensorEntityDescription(
+        key="api_current_latency",
+        translation_key="api_current_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:timer-outline",
+        endpoint=ENDPOINT_CURRENT,
+    ),
+    HavaDurumuApiSensorEntityDescription(
+        key="api_hourly_latency",
+        translation_key="api_hourly_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:timer-outline",
+        endpoint=ENDPOINT_HOURLY,
+    ),
+    HavaDurumuApiSensorEntityDescription(
+        key="api_daily_latency",
+        translation_key="api_daily_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:timer-outline",
+        endpoint=ENDPOINT_DAILY,
     ),
 )
 
@@ -205,16 +462,34 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hava Durumu sensor entities from a config entry."""
     coordinator: HavaDurumuDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Metrics of the shared alerts client are only in the diagnostics, remove
+    # the identical per-location sensor of earlier versions
+    registry = er.async_get(hass)
+    if entity_id := registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.data['merkez_id']}_api_alerts_latency"
+    ):
+        registry.async_remove(entity_id)
     
-    entities = [
+    entities: list[SensorEntity] = [
         HavaDurumuSensor(coordinator, entry, description)
         for description in SENSOR_DESCRIPTIONS
     ]
+    entities.extend(
+        HavaDurumuTrendSensor(coordinator, entry, description)
+        for description in TREND_SENSOR_DESCRIPTIONS
+    )
+    entities.extend(
+        HavaDurumuApiSensor(coordinator, entry, description)
+        for description in API_SENSOR_DESCRIPTIONS
+    )
     
     async_add_entities(entities)
 
 
-class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], SensorEntity):
+class HavaDurumuSensor(
+    SectionUpdateMixin, CoordinatorEntity[HavaDurumuDataUpdateCoordinator], SensorEntity
+):
     """Implementation of a Hava Durumu sensor."""
 
     _attr_has_entity_name = True
@@ -231,6 +506,7 @@ class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], Senso
         super().__init__(coordinator)
         self.entity_description = description
         self._entry = entry
+        self._data_sections = description.sections
         self._attr_unique_id = f"{entry.data['merkez_id']}_{description.key}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, str(entry.data["merkez_id"]))},
@@ -245,57 +521,27 @@ class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], Senso
         if not self.coordinator.data:
             return None
         
+        if self.entity_description.forecast_fn is not None:
+            return self.entity_description.forecast_fn(
+                self.coordinator.precipitation, dt_util.utcnow().timestamp()
+            )
+
         # Handle forecast sensors separately
         if self.entity_description.key == "forecast_today":
             daily = self.coordinator.data.get("daily", [])
             if daily and len(daily) > 0:
                 today = daily[0]
-                hadise_code = today.get("hadise", "")
-                return CONDITION_DESCRIPTIONS.get(hadise_code, hadise_code)
+                return CONDITION_DESCRIPTIONS.get(today.condition_code, today.condition_code)
             return None
         
         if self.entity_description.key == "forecast_tomorrow":
             daily = self.coordinator.data.get("daily", [])
             if daily and len(daily) > 1:
                 tomorrow = daily[1]
-                hadise_code = tomorrow.get("hadise", "")
-                return CONDITION_DESCRIPTIONS.get(hadise_code, hadise_code)
+                return CONDITION_DESCRIPTIONS.get(tomorrow.condition_code, tomorrow.condition_code)
             return None
         
         
-        # Handle weather prediction sensors
-        if self.entity_description.key == "rain_forecast_24h":
-            hourly = self.coordinator.data.get("hourly", [])
-            if not hourly:
-                return "Bilinmiyor"
-            
-            # Rain condition codes
-            rain_codes = ["HY", "Y", "KY", "MSY", "HSY", "SY", "KSY", "GSY", "KGY", "HHY"]
-            
-            # Check next 24 hours (hourly data)
-            for hour_data in hourly[:24]:
-                hadise = hour_data.get("hadise", "")
-                if hadise in rain_codes:
-                    return "Yağacak"
-            
-            return "Yağmayacak"
-        
-        if self.entity_description.key == "snow_forecast_24h":
-            hourly = self.coordinator.data.get("hourly", [])
-            if not hourly:
-                return "Bilinmiyor"
-            
-            # Snow condition codes
-            snow_codes = ["HKY", "K", "YKY", "KKY"]
-            
-            # Check next 24 hours (hourly data)
-            for hour_data in hourly[:24]:
-                hadise = hour_data.get("hadise", "")
-                if hadise in snow_codes:
-                    return "Yağacak"
-            
-            return "Yağmayacak"
-        
         # Handle alert sensors separately
         if self.entity_description.key == "notification_status":
             # Get notification setting from options
@@ -327,6 +573,17 @@ class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], Senso
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes for special sensors."""
+        if (field := self.entity_description.neighbor_field) is not None:
+            # Label values taken from a nearby station
+            source = ((self.coordinator.data or {}).get("neighbors") or {}).get(field)
+            if not source:
+                return {}
+            return {
+                "source": source["name"],
+                "source_merkez_id": source["merkez_id"],
+                "source_distance_km": source["distance_km"],
+            }
+
         if self.entity_description.key not in ["alert_details", "wind_bearing", "forecast_today", "forecast_tomorrow"]:
             return {}
         
@@ -339,10 +596,10 @@ class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], Senso
             if daily and len(daily) > 0:
                 today = daily[0]
                 return {
-                    "date": today.get("tarih"),
-                    "min_temp": today.get("enDusuk"),
-                    "max_temp": today.get("enYuksek"),
-                    "condition_code": today.get("hadise"),
+                    "date": today.date,
+                    "min_temp": today.temperature_low,
+                    "max_temp": today.temperature_high,
+                    "condition_code": today.condition_code,
                 }
             return {}
         
@@ -351,10 +608,10 @@ class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], Senso
             if daily and len(daily) > 1:
                 tomorrow = daily[1]
                 return {
-                    "date": tomorrow.get("tarih"),
-                    "min_temp": tomorrow.get("enDusuk"),
-                    "max_temp": tomorrow.get("enYuksek"),
-                    "condition_code": tomorrow.get("hadise"),
+                    "date": tomorrow.date,
+                    "min_temp": tomorrow.temperature_low,
+                    "max_temp": tomorrow.temperature_high,
+                    "condition_code": tomorrow.condition_code,
                 }
             return {}
         
@@ -366,7 +623,7 @@ class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], Senso
             if not current:
                 return {}
             
-            degrees = current.get("ruzgarYon")
+            degrees = current.wind_bearing
             if degrees is None:
                 return {}
             
@@ -413,3 +670,74 @@ class HavaDurumuSensor(CoordinatorEntity[HavaDurumuDataUpdateCoordinator], Senso
             attrs["total_alerts"] = len(all_alerts)
         
         return attrs
+
+
+class HavaDurumuTrendSensor(
+    SectionUpdateMixin, CoordinatorEntity[HavaDurumuDataUpdateCoordinator], SensorEntity
+):
+    """Change of a current conditions field over recent observations."""
+
+    _attr_has_entity_name = True
+    _attr_attribution = ATTRIBUTION
+    _data_sections = ("trends",)
+    entity_description: HavaDurumuTrendSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: HavaDurumuDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: HavaDurumuTrendSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.data['merkez_id']}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, str(entry.data["merkez_id"]))},
+            "name": coordinator.location_name,
+            "manufacturer": "MGM",
+            "model": "Hava Durumu",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the change, None until enough observations are kept."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get("trends", {}).get(self.entity_description.key)
+
+
+class HavaDurumuApiSensor(SensorEntity):
+    """Request metrics of one MGM endpoint, disabled by default."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = True
+    _unrecorded_attributes = frozenset({"histogram", "statuses"})
+    entity_description: HavaDurumuApiSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: HavaDurumuDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: HavaDurumuApiSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._client = coordinator.api
+        self._attr_unique_id = f"{entry.data['merkez_id']}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, str(entry.data["merkez_id"]))},
+            "name": coordinator.location_name,
+            "manufacturer": "MGM",
+            "model": "Hava Durumu",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean latency of the endpoint."""
+        return self._client.metrics.get(self.entity_description.endpoint).latency_mean_ms
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the counters of the endpoint."""
+        return self._client.metrics.get(self.entity_description.endpoint).as_dict()
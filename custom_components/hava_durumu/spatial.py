@@ -0,0 +1,123 @@
+"""Spatial index of MGM locations."""
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Iterable
+
+EARTH_RADIUS_KM = 6371.0
+
+Point = tuple[float, float, float]
+
+
+def _point(latitude: float, longitude: float) -> Point:
+    """Return the position on the unit sphere of a coordinate."""
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+
+def _chord_to_km(chord_squared: float) -> float:
+    """Return the great-circle distance of a squared chord on the unit sphere."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(chord_squared) / 2, 1.0))
+
+
+class StationIndex:
+    """KD-tree of the MGM locations for nearest station queries.
+
+    Coordinates are placed on the unit sphere, so straight line distances
+    order stations like great-circle distances do and the tree needs no
+    special handling of longitudes.
+    """
+
+    __slots__ = ("_locations", "_points", "_positions", "_nodes", "_root")
+
+    def __init__(self, locations: Iterable[dict[str, Any]]) -> None:
+        """Build the index from locations with coordinates."""
+        self._locations: list[dict[str, Any]] = []
+        self._points: list[Point] = []
+        self._positions: dict[int, int] = {}
+        for location in locations:
+            latitude, longitude = location.get("enlem"), location.get("boylam")
+            try:
+                merkez_id = int(location["merkezId"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float)):
+                continue
+            if merkez_id in self._positions:
+                continue
+            self._positions[merkez_id] = len(self._locations)
+            self._locations.append(location)
+            self._points.append(_point(latitude, longitude))
+
+        # Nodes are (position, axis, left node, right node), -1 is no child
+        self._nodes: list[tuple[int, int, int, int]] = []
+        self._root = self._build(list(range(len(self._points))), 0)
+
+    def __len__(self) -> int:
+        """Return the number of indexed locations."""
+        return len(self._locations)
+
+    def _build(self, positions: list[int], depth: int) -> int:
+        """Add the subtree of the given points and return its node."""
+        if not positions:
+            return -1
+        axis = depth % 3
+        positions.sort(key=lambda position: self._points[position][axis])
+        middle = len(positions) // 2
+        left = self._build(positions[:middle], depth + 1)
+        right = self._build(positions[middle + 1 :], depth + 1)
+        self._nodes.append((positions[middle], axis, left, right))
+        return len(self._nodes) - 1
+
+    def _query(
+        self, target: Point, count: int, max_distance_km: float, exclude: int | None
+    ) -> list[tuple[dict[str, Any], float]]:
+        """Return the count locations closest to a point with their distance in km."""
+        # Max heap of (-squared distance, position) of the best candidates
+        best: list[tuple[float, int]] = []
+        stack = [self._root]
+        while stack:
+            if (node := stack.pop()) == -1:
+                continue
+            position, axis, left, right = self._nodes[node]
+            point = self._points[position]
+            if position != exclude:
+                distance = sum((a - b) ** 2 for a, b in zip(point, target))
+                if len(best) < count:
+                    heapq.heappush(best, (-distance, position))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, position))
+            delta = target[axis] - point[axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            # The far side can only hold closer points if the splitting
+            # plane is nearer than the worst candidate
+            if len(best) < count or delta**2 < -best[0][0]:
+                stack.append(far)
+            stack.append(near)
+
+        return [
+            (self._locations[position], distance_km)
+            for negative, position in sorted(best, reverse=True)
+            if (distance_km := _chord_to_km(-negative)) <= max_distance_km
+        ]
+
+    def nearest(
+        self, merkez_id: Any, count: int, max_distance_km: float = math.inf
+    ) -> list[tuple[dict[str, Any], float]]:
+        """Return the closest other locations with their distance in km, nearest first."""
+        try:
+            own = self._positions.get(int(merkez_id))
+        except (TypeError, ValueError):
+            own = None
+        if own is None or count <= 0:
+            return []
+        return self._query(self._points[own], count, max_distance_km, own)
+
+    def nearest_to(
+        self, latitude: float, longitude: float, count: int = 1
+    ) -> list[tuple[dict[str, Any], float]]:
+        """Return the locations closest to a coordinate with their distance in km."""
+        if count <= 0:
+            return []
+        return self._query(_point(latitude, longitude), count, math.inf, None)
@@ -0,0 +1,152 @@
+"""Short term trends of current conditions."""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable
+
+from homeassistant.util import dt as dt_util
+
+from .const import ADAPTIVE_MIN_INTERVAL
+from .models import CurrentConditions
+
+# Current conditions fields with a trend
+TREND_FIELDS = ("pressure", "temperature", "humidity")
+
+# Windows in hours the change of a field is reported over, the rate per
+# hour is taken over RATE_WINDOW
+TREND_WINDOWS = (1, 3, 6)
+RATE_WINDOW = 3
+
+# A change is only reported if the reference observation is at most this
+# much older than the window, so gaps do not pass for short term changes
+WINDOW_TOLERANCE = 1.5
+
+# Seconds between kept observations, closer ones (manual refreshes) are
+# skipped. Current conditions are never polled faster on their own.
+MIN_SAMPLE_SPACING = ADAPTIVE_MIN_INTERVAL
+
+# Observations kept per field, enough for the longest window and its
+# tolerance at the closest spacing
+TREND_CAPACITY = int(max(TREND_WINDOWS) * 3600 * WINDOW_TOLERANCE // MIN_SAMPLE_SPACING) + 1
+
+
+class TrendRing:
+    """Fixed size ring buffer of (time, value) samples of one field.
+
+    Every window keeps a pointer to its reference sample, the newest
+    sample at least one window older than the latest. Pointers only move
+    forward, so appending a sample costs O(1) amortized and the changes
+    are read in O(1).
+    """
+
+    __slots__ = ("capacity", "_times", "_values", "_count", "_refs")
+
+    def __init__(self, capacity: int = TREND_CAPACITY) -> None:
+        """Initialize an empty ring."""
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Samples appended so far, sample n is stored at n % capacity
+        self._count = 0
+        # Window in seconds -> sequence number of its reference sample
+        self._refs: dict[int, int] = {window * 3600: -1 for window in TREND_WINDOWS}
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return min(self._count, self.capacity)
+
+    @property
+    def _oldest(self) -> int:
+        """Return the sequence number of the oldest sample still held."""
+        return max(self._count - self.capacity, 0)
+
+    def append(self, timestamp: float, value: float) -> bool:
+        """Add a sample spaced enough from the latest one, return False otherwise."""
+        count, capacity = self._count, self.capacity
+        if count and timestamp - self._times[(count - 1) % capacity] < MIN_SAMPLE_SPACING:
+            return False
+        self._times[count % capacity] = timestamp
+        self._values[count % capacity] = value
+        self._count = count = count + 1
+
+        oldest = self._oldest
+        for window, ref in self._refs.items():
+            # A reference that was overwritten is searched again from the oldest sample
+            ref = max(ref, oldest - 1)
+            while ref + 1 < count and self._times[(ref + 1) % capacity] <= timestamp - window:
+                ref += 1
+            self._refs[window] = ref
+        return True
+
+    def change(self, hours: int) -> tuple[float, float] | None:
+        """Return the change of the value over a window and its real span in hours."""
+        ref = self._refs[hours * 3600]
+        if not self._count or ref < self._oldest:
+            return None
+        latest = (self._count - 1) % self.capacity
+        span = self._times[latest] - self._times[ref % self.capacity]
+        if span > hours * 3600 * WINDOW_TOLERANCE:
+            return None
+        return self._values[latest] - self._values[ref % self.capacity], span / 3600
+
+    def samples(self) -> list[tuple[float, float]]:
+        """Return the samples held, oldest first."""
+        return [
+            (self._times[seq % self.capacity], self._values[seq % self.capacity])
+            for seq in range(self._oldest, self._count)
+        ]
+
+    def extend(self, samples: Iterable[tuple[float, float]]) -> None:
+        """Append samples in order."""
+        for timestamp, value in samples:
+            self.append(timestamp, value)
+
+
+class TrendTracker:
+    """Recent observations of a location and the trends derived from them."""
+
+    __slots__ = ("_rings",)
+
+    def __init__(self) -> None:
+        """Initialize empty rings."""
+        self._rings = {field: TrendRing() for field in TREND_FIELDS}
+
+    def observe(self, current: CurrentConditions, skip: Iterable[str] = ()) -> bool:
+        """Add a new observation, return True if any trend may have changed.
+
+        Fields in skip, for example values taken from a nearby station, are
+        not recorded.
+        """
+        if current.observed_at is None or (
+            observed_at := dt_util.parse_datetime(current.observed_at)
+        ) is None:
+            return False
+        timestamp = observed_at.timestamp()
+        changed = False
+        for field, ring in self._rings.items():
+            if field in skip or (value := getattr(current, field)) is None:
+                continue
+            changed |= ring.append(timestamp, float(value))
+        return changed
+
+    def values(self) -> dict[str, float | None]:
+        """Return the changes over every window and the rates per hour."""
+        values: dict[str, float | None] = {}
+        for field, ring in self._rings.items():
+            for hours in TREND_WINDOWS:
+                change = ring.change(hours)
+                values[f"{field}_change_{hours}h"] = round(change[0], 1) if change else None
+            change = ring.change(RATE_WINDOW)
+            values[f"{field}_rate"] = (
+                round(change[0] / change[1], 2) if change and change[1] else None
+            )
+        return values
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the samples for the snapshot."""
+        return {field: ring.samples() for field, ring in self._rings.items()}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the samples saved with as_dict."""
+        for field, ring in self._rings.items():
+            ring.extend((timestamp, value) for timestamp, value in data.get(field, []))
@@ -0,0 +1,43 @@
+"""Utility functions for Hava Durumu."""
+from __future__ import annotations
+
+# str.lower() turns "İ" into "i" plus a combining dot and cannot know
+# whether "I" is the capital of "ı" or of "i" (Iğdır vs ISTANBUL typed
+# without Turkish letters). All variants of the letter fold to "i", the
+# other Turkish letters to their ASCII base so "kec" finds Keçiören.
+_TURKISH_FOLD = str.maketrans(
+    {
+        "I": "i",
+        "İ": "i",
+        "ı": "i",
+        "Ç": "c",
+        "ç": "c",
+        "Ğ": "g",
+        "ğ": "g",
+        "Ö": "o",
+        "ö": "o",
+        "Ş": "s",
+        "ş": "s",
+        "Ü": "u",
+        "ü": "u",
+    }
+)
+
+
+def turkish_casefold(text: str) -> str:
+    """Return a case, accent and whitespace insensitive key for Turkish text."""
+    return " ".join(text.translate(_TURKISH_FOLD).lower().split())
+
+
+# Turkish alphabetical order, unicode code point order would put Ç, İ, Ö, Ş
+# and Ü after Z
+_TURKISH_LOWER = str.maketrans({"I": "ı", "İ": "i"})
+_TURKISH_ALPHABET = {letter: index for index, letter in enumerate(" abcçdefgğhıijklmnoöprsştuüvwxyz")}
+
+
+def turkish_sort_key(text: str) -> tuple[int, ...]:
+    """Return a key that sorts Turkish text alphabetically."""
+    return tuple(
+        _TURKISH_ALPHABET.get(char, len(_TURKISH_ALPHABET) + ord(char))
+        for char in text.translate(_TURKISH_LOWER).lower()
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.components.weather import (
     Forecast,
@@ -26,9 +26,13 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import HavaDurumuDataUpdateCoordinator
+from .entity import SectionUpdateMixin
+from .models import CurrentConditions
 
 _LOGGER = logging.getLogger(__name__)
 
+FORECAST_TYPES = ("daily", "hourly")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,7 +44,7 @@ async def async_setup_entry(
     async_add_entities([HavaDurumuWeather(coordinator, entry)])
 
 
-class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
+class HavaDurumuWeather(SectionUpdateMixin, SingleCoordinatorWeatherEntity):
     """Implementation of the Hava Durumu weather entity."""
 
     _attr_has_entity_name = True
@@ -49,6 +53,7 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
     _attr_native_pressure_unit = UnitOfPressure.HPA
     _attr_native_wind_speed_unit = UnitOfSpeed.KILOMETERS_PER_HOUR
     _attr_attribution = ATTRIBUTION
+    _data_sections = ("current", "daily", "stale", "neighbors")
 
     def __init__(
         self,
@@ -67,9 +72,50 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
         self._attr_supported_features = (
             WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_HOURLY
         )
+        # Forecast lists built for a data generation of the coordinator
+        self._forecast_cache: dict[str, tuple[int, list[Forecast] | None]] = {}
+        self._notified_generations: dict[str, int] = {
+            forecast_type: coordinator.generations.get(forecast_type, 0)
+            for forecast_type in FORECAST_TYPES
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        State is only written when current conditions or today's forecast
+        changed, forecast subscribers only when their forecast changed.
+        """
+        if self._inputs_changed():
+            self.async_write_ha_state()
+
+        changed = []
+        for forecast_type in FORECAST_TYPES:
+            generation = self.coordinator.generations.get(forecast_type, 0)
+            if generation != self._notified_generations[forecast_type]:
+                self._notified_generations[forecast_type] = generation
+                changed.append(forecast_type)
+
+        if changed:
+            self.coordinator.entry.async_create_task(
+                self.hass, self.async_update_listeners(changed)
+            )
+
+    def _cached_forecast(
+        self,
+        forecast_type: str,
+        build: Callable[[], list[Forecast] | None],
+    ) -> list[Forecast] | None:
+        """Return a forecast list, rebuilding it only when the data changed."""
+        generation = self.coordinator.generations.get(forecast_type, 0)
+        cached = self._forecast_cache.get(forecast_type)
+        if cached is None or cached[0] != generation:
+            cached = (generation, build())
+            self._forecast_cache[forecast_type] = cached
+        return cached[1]
 
     @property
-    def _current_data(self) -> dict[str, Any] | None:
+    def _current_data(self) -> CurrentConditions | None:
         """Get current weather data."""
         if self.coordinator.data:
             return self.coordinator.data.get("current")
@@ -79,7 +125,7 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
     def condition(self) -> str | None:
         """Return the current condition."""
         if self._current_data:
-            hadise = self._current_data.get("hadiseKodu")
+            hadise = self._current_data.condition_code
             if hadise:
                 return CONDITION_MAP.get(hadise, "cloudy")
         return None
@@ -88,14 +134,14 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
     def native_temperature(self) -> float | None:
         """Return the temperature."""
         if self._current_data:
-            return self._current_data.get("sicaklik")
+            return self._current_data.temperature
         return None
 
     @property
     def native_apparent_temperature(self) -> float | None:
         """Return the apparent temperature."""
         if self._current_data:
-            return self._current_data.get("hissedilenSicaklik")
+            return self._current_data.apparent_temperature
         return None
 
     @property
@@ -104,7 +150,7 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
         if self.coordinator.data:
             daily_data = self.coordinator.data.get("daily", [])
             if daily_data and len(daily_data) > 0:
-                return daily_data[0].get("enDusuk")
+                return daily_data[0].temperature_low
         return None
 
     @property
@@ -113,102 +159,116 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
         if self.coordinator.data:
             daily_data = self.coordinator.data.get("daily", [])
             if daily_data and len(daily_data) > 0:
-                return daily_data[0].get("enYuksek")
+                return daily_data[0].temperature_high
         return None
 
     @property
     def native_precipitation(self) -> float | None:
         """Return precipitation amount."""
         if self._current_data:
-            yagis = self._current_data.get("yagis1Saat")
-            if yagis and yagis != -9999:
-                return yagis
+            return self._current_data.precipitation_1h or None
         return None
 
     @property
     def humidity(self) -> float | None:
         """Return the humidity."""
         if self._current_data:
-            return self._current_data.get("nem")
+            return self._current_data.humidity
         return None
 
     @property
     def native_wind_speed(self) -> float | None:
         """Return the wind speed."""
         if self._current_data:
-            return self._current_data.get("ruzgarHiz")
+            return self._current_data.wind_speed
         return None
 
     @property
     def wind_bearing(self) -> float | None:
         """Return the wind bearing."""
         if self._current_data:
-            return self._current_data.get("ruzgarYon")
+            return self._current_data.wind_bearing
         return None
 
     @property
     def native_pressure(self) -> float | None:
         """Return the pressure."""
         if self._current_data:
-            return self._current_data.get("denizeIndirgenmisBasinc")
+            return self._current_data.pressure
         return None
 
     @property
     def native_visibility(self) -> float | None:
         """Return the visibility in meters."""
         if self._current_data:
-            gorus = self._current_data.get("gorus")
-            if gorus and gorus != -9999:
-                return gorus
+            return self._current_data.visibility or None
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         attrs = {}
-        if self._current_data:
-            hadise = self._current_data.get("hadiseKodu")
+        if current := self._current_data:
+            hadise = current.condition_code
             if hadise:
                 attrs["condition_text"] = CONDITION_DESCRIPTIONS.get(hadise, hadise)
             
             # Cloud coverage
-            kapalilik = self._current_data.get("kapalilik")
-            if kapalilik and kapalilik != -9999:
-                attrs["cloud_coverage"] = kapalilik
+            if current.cloud_coverage:
+                attrs["cloud_coverage"] = current.cloud_coverage
             
             # Precipitation data
-            yagis_10dk = self._current_data.get("yagis10Dk")
-            if yagis_10dk and yagis_10dk != -9999:
-                attrs["precipitation_10min"] = yagis_10dk
+            if current.precipitation_10m:
+                attrs["precipitation_10min"] = current.precipitation_10m
             
-            yagis_1saat = self._current_data.get("yagis1Saat")
-            if yagis_1saat and yagis_1saat != -9999:
-                attrs["precipitation_1h"] = yagis_1saat
+            if current.precipitation_1h:
+                attrs["precipitation_1h"] = current.precipitation_1h
             
-            yagis_6saat = self._current_data.get("yagis6Saat")
-            if yagis_6saat and yagis_6saat != -9999:
-                attrs["precipitation_6h"] = yagis_6saat
+            if current.precipitation_6h:
+                attrs["precipitation_6h"] = current.precipitation_6h
             
-            yagis_12saat = self._current_data.get("yagis12Saat")
-            if yagis_12saat and yagis_12saat != -9999:
-                attrs["precipitation_12h"] = yagis_12saat
+            if current.precipitation_12h:
+                attrs["precipitation_12h"] = current.precipitation_12h
             
-            yagis_24saat = self._current_data.get("yagis24Saat")
-            if yagis_24saat and yagis_24saat != -9999:
-                attrs["precipitation_24h"] = yagis_24saat
+            if current.precipitation_24h:
+                attrs["precipitation_24h"] = current.precipitation_24h
             
             # Actual pressure
-            if "aktuelBasinc" in self._current_data:
-                attrs["actual_pressure"] = self._current_data.get("aktuelBasinc")
+            if current.actual_pressure is not None:
+                attrs["actual_pressure"] = current.actual_pressure
             
             # Data time
-            if "veriZamani" in self._current_data:
-                attrs["data_time"] = self._current_data.get("veriZamani")
-        
+            if current.observed_at is not None:
+                attrs["data_time"] = current.observed_at
+
+        # Sections showing their last good data while MGM is failing, with
+        # the time they were last fetched
+        if self.coordinator.data and (stale := self.coordinator.data.get("stale")):
+            attrs["stale_data"] = {
+                section: updated_at.isoformat() if updated_at else None
+                for section, updated_at in sorted(stale.items())
+            }
+
+        # Fields the station does not measure, taken from nearby stations
+        if self.coordinator.data and (neighbors := self.coordinator.data.get("neighbors")):
+            attrs["neighbor_sources"] = {
+                field: source["name"] for field, source in sorted(neighbors.items())
+            }
+
         return attrs
 
-    async def async_forecast_daily(self) -> list[Forecast] | None:
+    @callback
+    def _async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast."""
+        return self._cached_forecast("daily", self._build_forecast_daily)
+
+    @callback
+    def _async_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the hourly forecast."""
+        return self._cached_forecast("hourly", self._build_forecast_hourly)
+
+    def _build_forecast_daily(self) -> list[Forecast] | None:
+        """Build the daily forecast from coordinator data."""
         if not self.coordinator.data:
             return None
         
@@ -221,23 +281,19 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
         for day in daily_data:
             try:
                 # Parse date
-                tarih = day.get("tarih")
+                tarih = day.date
                 if not tarih:
                     continue
                 
-                hadise = day.get("hadise")
+                hadise = day.condition_code
                 
                 forecast: Forecast = {
                     "datetime": tarih,
                     "condition": CONDITION_MAP.get(hadise, "cloudy") if hadise else None,
-                    "native_temperature": day.get("enYuksek"),
-                    "native_templow": day.get("enDusuk"),
+                    "native_temperature": day.temperature_high,
+                    "native_templow": day.temperature_low,
                 }
                 
-                # Add precipitation probability if available
-                if "ypiagpisMiktarpiMax" in day:
-                    forecast["precipitation"] = day.get("ypiagpisMiktarpiMax")
-                
                 forecasts.append(forecast)
             except Exception as err:
                 _LOGGER.debug("Error parsing daily forecast: %s", err)
@@ -245,8 +301,8 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
         
         return forecasts
 
-    async def async_forecast_hourly(self) -> list[Forecast] | None:
-        """Return the hourly forecast."""
+    def _build_forecast_hourly(self) -> list[Forecast] | None:
+        """Build the hourly forecast from coordinator data."""
         if not self.coordinator.data:
             return None
         
@@ -258,19 +314,19 @@ class HavaDurumuWeather(SingleCoordinatorWeatherEntity):
         
         for hour in hourly_data:
             try:
-                tarih = hour.get("tarih")
+                tarih = hour.datetime
                 if not tarih:
                     continue
                 
-                hadise = hour.get("hadise")
+                hadise = hour.condition_code
                 
                 forecast: Forecast = {
                     "datetime": tarih,
                     "condition": CONDITION_MAP.get(hadise, "cloudy") if hadise else None,
-                    "native_temperature": hour.get("sicaklik"),
-                    "humidity": hour.get("nem"),
-                    "native_wind_speed": hour.get("ruzgarHizi"),
-                    "wind_bearing": hour.get("ruzgarYonu"),
+                    "native_temperature": hour.temperature,
+                    "humidity": hour.humidity,
+                    "native_wind_speed": hour.wind_speed,
+                    "wind_bearing": hour.wind_bearing,
                 }
                 
                 forecasts.append(forecast)
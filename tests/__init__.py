@@ -0,0 +1 @@
+"""Tests of the Hava Durumu integration."""
@@ -0,0 +1,40 @@
+"""Fixtures for the Hava Durumu tests.
+
+Run from the repository root:
+
+    pip install -r tests/requirements.txt
+    pytest -c tests/pytest.ini tests
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from benchmarks.fake_mgm import FakeMGMConfig, FakeMGMServer  # noqa: E402
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+async def fake_mgm(
+    hass: HomeAssistant, socket_enabled: None
+) -> AsyncGenerator[FakeMGMServer, None]:
+    """Start the fake MGM server of the benchmarks and point every API client at it."""
+    server = FakeMGMServer(FakeMGMConfig())
+    base_url = await server.start()
+    with patch("custom_components.hava_durumu.api.API_BASE_URL", base_url):
+        yield server
+    await server.stop()
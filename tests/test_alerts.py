@@ -0,0 +1,25 @@
+"""Tests of the alert location index."""
+from __future__ import annotations
+
+from custom_components.hava_durumu.alerts import AlertIndex
+
+
+def test_lookup_by_province_region_and_center() -> None:
+    """Alerts are returned for the locations they name."""
+    alerts = [{"il": "Ankara"}, {"merkezId": 90610}, {"il": "İzmir"}]
+    meteoalarm = [{"bolge": "Karadeniz Bölgesi"}, {"bolge": "Ege"}]
+    index = AlertIndex(alerts, meteoalarm)
+
+    assert index.lookup(90610, "Ankara") == (alerts[:2], [])
+    assert index.lookup(96101, "Trabzon") == ([], meteoalarm[:1])
+    assert index.lookup(93501, "İzmir") == (alerts[2:], meteoalarm[1:])
+
+
+def test_unknown_area_applies_everywhere() -> None:
+    """Alerts naming a sub-region or an unknown place are never dropped."""
+    alerts = [{"il": "Ankara"}, {"il": "Bilinmeyen Yer"}]
+    meteoalarm = [{"bolge": "Doğu Karadeniz"}, {"bolge": "Ege"}]
+    index = AlertIndex(alerts, meteoalarm)
+
+    assert index.lookup(96101, "Trabzon") == (alerts[1:], meteoalarm[:1])
+    assert index.lookup(90601, "Ankara") == (alerts, meteoalarm[:1])
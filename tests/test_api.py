@@ -0,0 +1,31 @@
+"""Tests of the MGM API client against the fake server."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from benchmarks.fake_mgm import FakeMGMServer
+from custom_components.hava_durumu.api import MGMApiClient
+from custom_components.hava_durumu.archive import ResponseRecorder, read_archive
+
+
+async def test_seeded_responses_are_revalidated(
+    hass: HomeAssistant, fake_mgm: FakeMGMServer, tmp_path: Path
+) -> None:
+    """A client seeded from an archive revalidates every response first."""
+    session = async_get_clientsession(hass)
+    recorder = ResponseRecorder(str(tmp_path / "responses.jsonl.gz"))
+    await MGMApiClient(session, fake_mgm.base_url, recorder=recorder).get_all_data(90000)
+    await recorder.async_flush()
+    archived = await hass.async_add_executor_job(read_archive, recorder.path)
+    assert archived
+
+    client = MGMApiClient(session, fake_mgm.base_url)
+    client.seed_cache(archived)
+    fake_mgm.reset_stats()
+    await client.get_all_data(90000)
+
+    assert fake_mgm.statuses[304] == len(archived)
+    assert fake_mgm.statuses[200] == 0
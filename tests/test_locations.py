@@ -0,0 +1,35 @@
+"""Tests of the offline location index."""
+from __future__ import annotations
+
+from custom_components.hava_durumu.locations import LocationIndex
+
+LOCATIONS = [
+    {"il": "Ankara", "ilce": "Çankaya", "merkezId": 90601},
+    {"il": "Ankara", "ilce": "Keçiören", "merkezId": 90610},
+    {"il": "İstanbul", "ilce": "Şişli", "merkezId": 93436},
+    {"il": "Muğla", "ilce": "Bodrum", "merkezId": 94804},
+    {"il": "Muğla", "ilce": "Merkez", "merkezId": 94801},
+]
+
+
+def _districts(results: list[dict]) -> list[str]:
+    """Return the district names of search results."""
+    return [location["ilce"] for location in results]
+
+
+def test_search_without_turkish_letters() -> None:
+    """Queries typed without Turkish letters find the districts."""
+    index = LocationIndex(LOCATIONS)
+    assert _districts(index.search("kec")) == ["Keçiören"]
+    assert _districts(index.search("ankara kec")) == ["Keçiören"]
+    assert _districts(index.search("sisli")) == ["Şişli"]
+    assert _districts(index.search("mugla")) == ["Bodrum", "Merkez"]
+
+
+def test_search_with_turkish_letters() -> None:
+    """Queries with Turkish letters in any case find the districts."""
+    index = LocationIndex(LOCATIONS)
+    assert _districts(index.search("KEÇ")) == ["Keçiören"]
+    assert _districts(index.search("İSTANBUL ŞİŞ")) == ["Şişli"]
+    assert _districts(index.search("çan")) == ["Çankaya"]
+    assert index.search("kecx") == []
@@ -0,0 +1,45 @@
+"""Tests of the hourly forecast precipitation index."""
+from __future__ import annotations
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.hava_durumu.models import HourlyForecast
+from custom_components.hava_durumu.precipitation import PrecipitationIndex
+
+START = dt_util.parse_datetime("2026-10-17T00:00:00+00:00").timestamp()
+HOUR = 3600.0
+
+
+def _index(codes: list[str]) -> PrecipitationIndex:
+    """Return the index of hourly slots with the given condition codes."""
+    return PrecipitationIndex(
+        HourlyForecast(
+            datetime=dt_util.utc_from_timestamp(START + slot * HOUR).isoformat(),
+            condition_code=code,
+        )
+        for slot, code in enumerate(codes)
+    )
+
+
+def test_dry_window_while_wet() -> None:
+    """While it rains the window starts when the rain stops."""
+    index = _index(["Y", "Y", "A", "A", "Y", "A"])
+    assert index.dry_window(START + 0.5 * HOUR) == (START + 2 * HOUR, START + 4 * HOUR)
+
+
+def test_dry_window_start_stable_while_dry() -> None:
+    """While it is dry the start does not move with the current time."""
+    index = _index(["Y", "A", "A", "A", "Y", "A"])
+    for hours in (1.0, 2.5, 3.9):
+        assert index.dry_window(START + hours * HOUR) == (START + HOUR, START + 4 * HOUR)
+
+    index = _index(["A", "A", "Y", "A"])
+    assert index.dry_window(START + 0.5 * HOUR) == (None, START + 2 * HOUR)
+    assert index.dry_window(START + 1.5 * HOUR) == (None, START + 2 * HOUR)
+    assert index.dry_window(START + 3.5 * HOUR) == (START + 3 * HOUR, None)
+
+
+def test_dry_window_stays_wet() -> None:
+    """No window while the forecast stays wet."""
+    index = _index(["Y", "KKY"])
+    assert index.dry_window(START + 0.5 * HOUR) is None
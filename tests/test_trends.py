@@ -0,0 +1,36 @@
+"""Tests of the trend ring buffers."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hava_durumu.trends import MIN_SAMPLE_SPACING, TrendRing
+
+
+def test_longest_window_at_closest_spacing() -> None:
+    """A day of observations at the closest spacing keeps the 6 hour reference."""
+    ring = TrendRing()
+    for sample in range(24 * 3600 // MIN_SAMPLE_SPACING):
+        ring.append(sample * MIN_SAMPLE_SPACING, 1000 + sample * 0.1)
+
+    change = ring.change(6)
+    assert change is not None
+    assert change[0] == pytest.approx(6 * 3600 // MIN_SAMPLE_SPACING * 0.1)
+    assert change[1] == 6
+
+
+def test_close_samples_are_skipped() -> None:
+    """Samples closer than the minimum spacing do not push out older ones."""
+    ring = TrendRing()
+    assert ring.append(0.0, 1.0)
+    assert not ring.append(MIN_SAMPLE_SPACING - 1, 2.0)
+    assert ring.append(MIN_SAMPLE_SPACING, 3.0)
+    assert ring.samples() == [(0.0, 1.0), (MIN_SAMPLE_SPACING, 3.0)]
+
+
+def test_gap_is_not_reported_as_change() -> None:
+    """No change is reported when the reference is far older than the window."""
+    ring = TrendRing()
+    ring.append(0.0, 1.0)
+    ring.append(3 * 3600.0, 2.0)
+    assert ring.change(1) is None
+    assert ring.change(3) == (1.0, 3.0)